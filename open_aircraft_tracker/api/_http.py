@@ -0,0 +1,222 @@
+"""
+Shared HTTP helpers for the API clients.
+All clients reuse a single aiohttp session so that keep-alive connections are pooled,
+and requests go through a rate limiter with retries for transient failures.
+"""
+import asyncio
+import random
+import time
+from typing import Any, Dict, Optional
+
+import aiohttp
+import orjson
+
+from open_aircraft_tracker.utils.cache import TTLCache
+from open_aircraft_tracker.utils.logging import logger
+
+# aiohttp can only decode brotli responses when a brotli package is installed
+try:
+    import brotli  # noqa: F401
+    ACCEPT_ENCODING = "gzip, deflate, br"
+except ImportError:
+    ACCEPT_ENCODING = "gzip, deflate"
+
+# HTTP status codes that indicate a transient failure worth retrying
+RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Retry settings
+MAX_ATTEMPTS = 3
+BASE_BACKOFF = 0.5  # seconds
+MAX_BACKOFF = 10.0  # seconds
+
+# Seconds to keep idle connections open, longer than the usual update intervals so that
+# consecutive polls reuse the connection instead of doing a new TLS handshake
+KEEPALIVE_TIMEOUT = 75.0
+
+# Module-level session shared by all API clients
+_session: Optional[aiohttp.ClientSession] = None
+
+
+class AsyncTokenBucket:
+    """Token bucket rate limiter for asyncio code."""
+
+    def __init__(self, max_tokens: float, refill_per_sec: float):
+        """
+        Initialize the rate limiter.
+
+        Args:
+            max_tokens: Maximum number of tokens (burst size)
+            refill_per_sec: Number of tokens added per second
+        """
+        self.max_tokens = max_tokens
+        self.refill_per_sec = refill_per_sec
+        self.tokens = float(max_tokens)
+        self.last_refill = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    def _refill(self):
+        """Add the tokens accumulated since the last refill."""
+        now = time.monotonic()
+        self.tokens = min(self.max_tokens, self.tokens + (now - self.last_refill) * self.refill_per_sec)
+        self.last_refill = now
+
+    async def acquire(self):
+        """Wait until a token is available and consume it."""
+        async with self.lock:
+            self._refill()
+            while self.tokens < 1:
+                await asyncio.sleep((1 - self.tokens) / self.refill_per_sec)
+                self._refill()
+            self.tokens -= 1
+
+
+async def get_session() -> aiohttp.ClientSession:
+    """
+    Get the shared HTTP session, creating it on first use.
+
+    Returns:
+        Shared aiohttp ClientSession instance
+    """
+    global _session
+
+    if _session is None or _session.closed:
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=100,
+                limit_per_host=10,
+                keepalive_timeout=KEEPALIVE_TIMEOUT,
+                enable_cleanup_closed=True
+            ),
+            timeout=aiohttp.ClientTimeout(total=30, connect=10),
+            # Ask for compressed JSON, aiohttp decompresses it transparently
+            headers={"Accept": "application/json", "Accept-Encoding": ACCEPT_ENCODING},
+            # Raise ClientResponseError for any error status, which the retry logic relies on
+            raise_for_status=True
+        )
+
+    return _session
+
+
+async def close_session():
+    """Close the shared HTTP session if it is open."""
+    global _session
+
+    if _session is not None and not _session.closed:
+        await _session.close()
+
+    _session = None
+
+
+def _retry_delay(error: aiohttp.ClientResponseError, attempt: int) -> float:
+    """
+    Calculate how long to wait before retrying a failed request.
+
+    Args:
+        error: The error raised for the failed request
+        attempt: Zero-based number of the failed attempt
+
+    Returns:
+        Delay in seconds
+    """
+    # Honor the server's Retry-After header if it gives a number of seconds
+    retry_after = error.headers.get("Retry-After") if error.headers else None
+    if retry_after:
+        try:
+            return min(MAX_BACKOFF, max(0.0, float(retry_after)))
+        except ValueError:
+            pass
+
+    # Otherwise use exponential backoff with jitter
+    return min(MAX_BACKOFF, BASE_BACKOFF * 2 ** attempt) * random.uniform(0.5, 1.0)
+
+
+async def fetch_json(
+    url: str,
+    params: Optional[Dict[str, Any]] = None,
+    headers: Optional[Dict[str, str]] = None,
+    auth: Optional[aiohttp.BasicAuth] = None,
+    limiter: Optional[AsyncTokenBucket] = None,
+    cache: Optional[TTLCache] = None,
+    cache_ttl: Optional[float] = None
+) -> Dict:
+    """
+    Make a GET request using the shared session and decode the JSON response.
+
+    Transient failures (429 and 5xx responses) are retried with exponential backoff,
+    other errors are raised immediately.
+
+    When a cache is given, expired responses are revalidated with their ETag and
+    Last-Modified headers, and a response that is unchanged (a 304, or the same body
+    as before) returns the previously decoded object without decoding it again.
+
+    Args:
+        url: Request URL
+        params: Query parameters
+        headers: Request headers
+        auth: Basic authentication credentials
+        limiter: Rate limiter to acquire a token from before each attempt
+        cache: Cache of recent responses, keyed by URL and query parameters
+        cache_ttl: Time-to-live of the cached response in seconds (defaults to the cache's ttl)
+
+    Returns:
+        JSON response as a dictionary, or None if the response has no body
+    """
+    # Cached entries are (decoded response, ETag, Last-Modified, hash of the body)
+    stale = None
+    if cache is not None:
+        cache_key = (url, tuple(sorted(params.items())) if params else ())
+
+        # Serve identical requests made in quick succession from the cache
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return cached[0]
+
+        # Ask the server to confirm that an expired response is still current
+        stale = cache.get_stale(cache_key)
+        if stale is not None and (stale[1] or stale[2]):
+            headers = dict(headers) if headers else {}
+            if stale[1]:
+                headers["If-None-Match"] = stale[1]
+            if stale[2]:
+                headers["If-Modified-Since"] = stale[2]
+
+    session = await get_session()
+
+    for attempt in range(MAX_ATTEMPTS):
+        if limiter is not None:
+            await limiter.acquire()
+
+        try:
+            async with session.get(url, params=params, headers=headers, auth=auth) as response:
+                # The server confirmed that the expired response is still current
+                if response.status == 304 and stale is not None:
+                    cache.put(cache_key, stale, cache_ttl)
+                    return stale[0]
+
+                body = await response.read()
+                etag = response.headers.get("ETag")
+                last_modified = response.headers.get("Last-Modified")
+
+            # Servers without validators often send the same body again until their data is
+            # updated, reuse the decoded response instead of decoding it again
+            body_hash = hash(body)
+            if stale is not None and stale[3] == body_hash:
+                cache.put(cache_key, stale, cache_ttl)
+                return stale[0]
+
+            # orjson decodes the large flight payloads much faster than the stdlib json module
+            # (empty bodies, e.g. from 204 responses, have no JSON to decode)
+            result = orjson.loads(body) if body else None
+
+            if cache is not None and result is not None:
+                cache.put(cache_key, (result, etag, last_modified, body_hash), cache_ttl)
+
+            return result
+        except aiohttp.ClientResponseError as e:
+            # Non-retryable errors and the last attempt are raised to the caller
+            if e.status not in RETRYABLE_STATUSES or attempt == MAX_ATTEMPTS - 1:
+                raise
+
+            delay = _retry_delay(e, attempt)
+            logger.warning(f"Request to {url} failed with status {e.status}, retrying in {delay:.1f} seconds")
+            await asyncio.sleep(delay)
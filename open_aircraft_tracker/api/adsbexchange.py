@@ -2,14 +2,18 @@
 ADSBexchange API client implementation.
 Documentation: https://www.adsbexchange.com/data/
 """
-import asyncio
-from datetime import datetime
-from typing import Dict, List, Optional, Tuple, Any
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Any
 
-import aiohttp
-from geopy.distance import geodesic
+import numpy as np
 
-from open_aircraft_tracker.api.base import Aircraft, AircraftTrackerAPI
+from open_aircraft_tracker.api._http import AsyncTokenBucket, fetch_json
+from open_aircraft_tracker.api.base import (
+    FPM_TO_MS, FT_TO_M, KT_TO_MS, Aircraft, AircraftTrackerAPI, intern_string,
+    normalize_callsign, optional_float
+)
+from open_aircraft_tracker.utils.cache import TTLCache
+from open_aircraft_tracker.utils.geo import filter_within_radius
 
 
 class ADSBexchangeAPI(AircraftTrackerAPI):
@@ -17,6 +21,10 @@ class ADSBexchangeAPI(AircraftTrackerAPI):
     
     BASE_URL = "https://adsbexchange-com1.p.rapidapi.com/v2"
     
+    # Unit conversion factors for the numeric columns:
+    # lat, lon, alt_baro (feet -> meters), gs (knots -> m/s), track, baro_rate (feet/min -> m/s)
+    COLUMN_FACTORS = np.array([1.0, 1.0, FT_TO_M, KT_TO_MS, 1.0, FPM_TO_MS])
+    
     def __init__(self, api_key: str):
         """
         Initialize the ADSBexchange API client.
@@ -33,68 +41,106 @@ class ADSBexchangeAPI(AircraftTrackerAPI):
             "X-RapidAPI-Key": api_key,
             "X-RapidAPI-Host": "adsbexchange-com1.p.rapidapi.com"
         }
+        
+        # Limit the request rate to avoid tripping the provider's rate limits
+        self._limiter = AsyncTokenBucket(max_tokens=5, refill_per_sec=1.0)
+        
+        # Reuse responses for identical requests made in quick succession
+        self._response_cache = TTLCache(maxsize=64, ttl=self.RADIUS_CACHE_TTL)
     
-    async def _make_request(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Dict:
+    async def _make_request(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        cache_ttl: Optional[float] = None
+    ) -> Dict:
         """
         Make a request to the ADSBexchange API.
         
         Args:
             endpoint: API endpoint
             params: Query parameters
+            cache_ttl: Seconds to reuse the response for (defaults to RADIUS_CACHE_TTL)
             
         Returns:
             JSON response as a dictionary
         """
         url = f"{self.BASE_URL}/{endpoint}"
         
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, params=params, headers=self.headers) as response:
-                if response.status == 200:
-                    return await response.json()
-                else:
-                    response.raise_for_status()
+        return await fetch_json(
+            url,
+            params=params,
+            headers=self.headers,
+            limiter=self._limiter,
+            cache=self._response_cache,
+            cache_ttl=cache_ttl
+        )
     
-    def _parse_aircraft(self, flight_data: Dict) -> Aircraft:
+    def _parse_columns(self, flights: List[Dict]) -> np.ndarray:
+        """
+        Collect the numeric fields of all flights into columns and convert their units.
+        
+        Args:
+            flights: Flight data from the ADSBexchange API
+            
+        Returns:
+            Array with one row per flight and the columns latitude, longitude,
+            altitude (m), velocity (m/s), heading and vertical rate (m/s); NaN marks missing values
+        """
+        columns = np.array(
+            [
+                (flight.get("lat"), flight.get("lon"), flight.get("alt_baro"),
+                 flight.get("gs"), flight.get("track"), flight.get("baro_rate"))
+                for flight in flights
+            ],
+            dtype=np.float64
+        ).reshape(-1, 6)
+        
+        # Convert feet to meters, knots to m/s and feet/min to m/s in one step
+        columns *= self.COLUMN_FACTORS
+        
+        return columns
+    
+    def _parse_aircraft(
+        self,
+        flight_data: Dict,
+        values: Optional[np.ndarray] = None,
+        now: Optional[datetime] = None
+    ) -> Aircraft:
         """
         Parse flight data from the ADSBexchange API into an Aircraft object.
         
         Args:
             flight_data: Flight data from the ADSBexchange API
+            values: Row of converted numeric values from _parse_columns (computed if not given)
+            now: Time of the poll that 'seen' is relative to (defaults to the current time)
             
         Returns:
             Aircraft object
         """
+        if values is None:
+            values = self._parse_columns([flight_data])[0]
+        
+        if now is None:
+            now = datetime.now()
+        
+        # ADSBexchange provides 'seen' as seconds ago, so we need to subtract it from the poll time
+        last_update = now - timedelta(seconds=flight_data.get("seen") or 0)
+        
         # Extract ICAO24 (hex identifier)
         icao24 = flight_data.get("hex", "").lower()
         
         # Extract other fields
-        callsign = flight_data.get("flight", "").strip()
-        origin_country = flight_data.get("cou")
-        latitude = flight_data.get("lat")
-        longitude = flight_data.get("lon")
-        altitude = flight_data.get("alt_baro") * 0.3048 if flight_data.get("alt_baro") else None  # Convert feet to meters
-        velocity = flight_data.get("gs") * 0.514444 if flight_data.get("gs") else None  # Convert knots to m/s
-        heading = flight_data.get("track")
-        vertical_rate = flight_data.get("baro_rate") * 0.00508 if flight_data.get("baro_rate") else None  # Convert feet/min to m/s
-        
-        # Use timestamp or current time
-        timestamp = flight_data.get("seen", 0)
-        last_update = datetime.now()
-        if timestamp:
-            # ADSBexchange provides 'seen' as seconds ago, so we need to subtract from current time
-            last_update = datetime.now().replace(microsecond=0) - datetime.timedelta(seconds=timestamp)
+        callsign = normalize_callsign(flight_data.get("flight", ""))
+        latitude, longitude, altitude, velocity, heading, vertical_rate = (optional_float(value) for value in values)
+        
+        # Intern strings that repeat heavily across aircraft and polls
+        callsign = intern_string(callsign)
+        origin_country = intern_string(flight_data.get("cou"))
         
         return Aircraft(
-            icao24=icao24,
-            callsign=callsign,
-            origin_country=origin_country,
-            latitude=latitude,
-            longitude=longitude,
-            altitude=altitude,
-            velocity=velocity,
-            heading=heading,
-            vertical_rate=vertical_rate,
-            last_update=last_update
+            icao24, callsign, origin_country, latitude, longitude,
+            altitude, velocity, heading, vertical_rate, last_update
         )
     
     async def get_aircraft_in_radius(self, latitude: float, longitude: float, radius_km: float) -> List[Aircraft]:
@@ -121,24 +167,19 @@ class ADSBexchangeAPI(AircraftTrackerAPI):
         
         # Parse the response
         aircraft_list = []
-        if response and "ac" in response:
-            center = (latitude, longitude)
+        if response and response.get("ac"):
+            flights = response["ac"]
+            
+            # Parse all numeric fields at once (missing values become NaN)
+            columns = self._parse_columns(flights)
+            
+            # Use the server time of the response when available, so 'seen' is relative to it
+            now = datetime.fromtimestamp(response["now"] / 1000) if response.get("now") else datetime.now()
             
-            for flight in response["ac"]:
-                # Parse flight data
-                aircraft = self._parse_aircraft(flight)
-                
-                # Skip aircraft without position data
-                if aircraft.latitude is None or aircraft.longitude is None:
-                    continue
-                
-                # Calculate actual distance
-                aircraft_pos = (aircraft.latitude, aircraft.longitude)
-                distance = geodesic(center, aircraft_pos).kilometers
-                
-                # Only include aircraft within the specified radius
-                if distance <= radius_km:
-                    aircraft_list.append(aircraft)
+            # Only build Aircraft objects for aircraft within the specified radius
+            mask = filter_within_radius(latitude, longitude, columns[:, 0], columns[:, 1], radius_km)
+            for index in np.flatnonzero(mask):
+                aircraft_list.append(self._parse_aircraft(flights[index], columns[index], now))
         
         return aircraft_list
     
@@ -153,7 +194,7 @@ class ADSBexchangeAPI(AircraftTrackerAPI):
             Aircraft object if found, None otherwise
         """
         # Normalize callsign
-        normalized_callsign = callsign.strip().upper()
+        normalized_callsign = normalize_callsign(callsign)
         
         # Query parameters for the search
         params = {
@@ -161,7 +202,7 @@ class ADSBexchangeAPI(AircraftTrackerAPI):
         }
         
         # Make the request to the callsign endpoint
-        response = await self._make_request("callsign", params)
+        response = await self._make_request("callsign", params, cache_ttl=self.CALLSIGN_CACHE_TTL)
         
         # Parse the response
         if response and "ac" in response and response["ac"]:
@@ -2,14 +2,18 @@
 AirLabs API client implementation.
 Documentation: https://airlabs.co/docs/
 """
-import asyncio
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, List, Optional, Any
 
-import aiohttp
-from geopy.distance import geodesic
+import numpy as np
 
-from open_aircraft_tracker.api.base import Aircraft, AircraftTrackerAPI
+from open_aircraft_tracker.api._http import AsyncTokenBucket, fetch_json
+from open_aircraft_tracker.api.base import (
+    FT_TO_M, KT_TO_MS, Aircraft, AircraftTrackerAPI, intern_string, normalize_callsign,
+    optional_float
+)
+from open_aircraft_tracker.utils.cache import TTLCache
+from open_aircraft_tracker.utils.geo import filter_within_radius
 
 
 class AirLabsAPI(AircraftTrackerAPI):
@@ -17,6 +21,10 @@ class AirLabsAPI(AircraftTrackerAPI):
     
     BASE_URL = "https://airlabs.co/api/v9"
     
+    # Unit conversion factors for the numeric columns:
+    # lat, lng, alt (feet -> meters), speed (knots -> m/s), dir
+    COLUMN_FACTORS = np.array([1.0, 1.0, FT_TO_M, KT_TO_MS, 1.0])
+    
     def __init__(self, api_key: str):
         """
         Initialize the AirLabs API client.
@@ -27,14 +35,26 @@ class AirLabsAPI(AircraftTrackerAPI):
         self.api_key = api_key
         if not api_key:
             raise ValueError("AirLabs API key is required")
+        
+        # Limit the request rate to avoid tripping the provider's rate limits
+        self._limiter = AsyncTokenBucket(max_tokens=5, refill_per_sec=1.0)
+        
+        # Reuse responses for identical requests made in quick succession
+        self._response_cache = TTLCache(maxsize=64, ttl=self.RADIUS_CACHE_TTL)
     
-    async def _make_request(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Dict:
+    async def _make_request(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        cache_ttl: Optional[float] = None
+    ) -> Dict:
         """
         Make a request to the AirLabs API.
         
         Args:
             endpoint: API endpoint
             params: Query parameters
+            cache_ttl: Seconds to reuse the response for (defaults to RADIUS_CACHE_TTL)
             
         Returns:
             JSON response as a dictionary
@@ -46,50 +66,77 @@ class AirLabsAPI(AircraftTrackerAPI):
             params = {}
         params["api_key"] = self.api_key
         
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, params=params) as response:
-                if response.status == 200:
-                    return await response.json()
-                else:
-                    response.raise_for_status()
+        return await fetch_json(
+            url,
+            params=params,
+            limiter=self._limiter,
+            cache=self._response_cache,
+            cache_ttl=cache_ttl
+        )
     
-    def _parse_aircraft(self, flight_data: Dict) -> Aircraft:
+    def _parse_columns(self, flights: List[Dict]) -> np.ndarray:
+        """
+        Collect the numeric fields of all flights into columns and convert their units.
+        
+        Args:
+            flights: Flight data from the AirLabs API
+            
+        Returns:
+            Array with one row per flight and the columns latitude, longitude,
+            altitude (m), velocity (m/s) and heading; NaN marks missing values
+        """
+        columns = np.array(
+            [
+                (flight.get("lat"), flight.get("lng"), flight.get("alt"), flight.get("speed"), flight.get("dir"))
+                for flight in flights
+            ],
+            dtype=np.float64
+        ).reshape(-1, 5)
+        
+        # Convert feet to meters and knots to m/s in one step
+        columns *= self.COLUMN_FACTORS
+        
+        return columns
+    
+    def _parse_aircraft(
+        self,
+        flight_data: Dict,
+        values: Optional[np.ndarray] = None,
+        now: Optional[datetime] = None
+    ) -> Aircraft:
         """
         Parse flight data from the AirLabs API into an Aircraft object.
         
         Args:
             flight_data: Flight data from the AirLabs API
+            values: Row of converted numeric values from _parse_columns (computed if not given)
+            now: Time of the poll, used when the flight has no timestamp (defaults to the current time)
             
         Returns:
             Aircraft object
         """
+        if values is None:
+            values = self._parse_columns([flight_data])[0]
+        
         # AirLabs uses hex for ICAO24, but we need to ensure it's lowercase
         icao24 = flight_data.get("hex", "").lower()
         
         # Extract other fields
         callsign = flight_data.get("flight_iata") or flight_data.get("flight_icao")
-        origin_country = flight_data.get("flag")
-        latitude = flight_data.get("lat")
-        longitude = flight_data.get("lng")
-        altitude = flight_data.get("alt") * 0.3048 if flight_data.get("alt") else None  # Convert feet to meters
-        velocity = flight_data.get("speed") * 0.514444 if flight_data.get("speed") else None  # Convert knots to m/s
-        heading = flight_data.get("dir")
+        latitude, longitude, altitude, velocity, heading = (optional_float(value) for value in values)
         vertical_rate = None  # AirLabs doesn't provide vertical rate
         
-        # Use current time as last update if not provided
-        last_update = datetime.now()
+        # Use the update timestamp or the time of the poll if not provided
+        updated = flight_data.get("updated")
+        last_update = datetime.fromtimestamp(updated) if updated else (now or datetime.now())
+        
+        # Intern strings that repeat heavily across aircraft and polls
+        callsign = intern_string(normalize_callsign(callsign) if callsign else callsign)
+        origin_country = intern_string(flight_data.get("flag"))
         
         return Aircraft(
-            icao24=icao24,
-            callsign=callsign,
-            origin_country=origin_country,
-            latitude=latitude,
-            longitude=longitude,
-            altitude=altitude,
-            velocity=velocity,
-            heading=heading,
-            vertical_rate=vertical_rate,
-            last_update=last_update
+            icao24, callsign, origin_country, latitude, longitude,
+            altitude, velocity, heading, vertical_rate, last_update
         )
     
     async def get_aircraft_in_radius(self, latitude: float, longitude: float, radius_km: float) -> List[Aircraft]:
@@ -118,27 +165,18 @@ class AirLabsAPI(AircraftTrackerAPI):
         # Parse the response
         aircraft_list = []
         if response and "response" in response and response["response"]:
-            center = (latitude, longitude)
+            flights = response["response"]
+            
+            # Parse all numeric fields at once (missing values become NaN)
+            columns = self._parse_columns(flights)
+            
+            # Use a single poll time for all aircraft in the response
+            now = datetime.now()
             
-            for flight in response["response"]:
-                # Skip flights without position data
-                if "lat" not in flight or "lng" not in flight:
-                    continue
-                
-                # Parse flight data
-                aircraft = self._parse_aircraft(flight)
-                
-                # Skip aircraft without position data
-                if aircraft.latitude is None or aircraft.longitude is None:
-                    continue
-                
-                # Calculate actual distance
-                aircraft_pos = (aircraft.latitude, aircraft.longitude)
-                distance = geodesic(center, aircraft_pos).kilometers
-                
-                # Only include aircraft within the specified radius
-                if distance <= radius_km:
-                    aircraft_list.append(aircraft)
+            # Only build Aircraft objects for aircraft within the specified radius
+            mask = filter_within_radius(latitude, longitude, columns[:, 0], columns[:, 1], radius_km)
+            for index in np.flatnonzero(mask):
+                aircraft_list.append(self._parse_aircraft(flights[index], columns[index], now))
         
         return aircraft_list
     
@@ -153,7 +191,7 @@ class AirLabsAPI(AircraftTrackerAPI):
             Aircraft object if found, None otherwise
         """
         # Normalize callsign
-        normalized_callsign = callsign.strip().upper()
+        normalized_callsign = normalize_callsign(callsign)
         
         # Query parameters
         params = {
@@ -161,7 +199,7 @@ class AirLabsAPI(AircraftTrackerAPI):
         }
         
         # Make the request
-        response = await self._make_request("flight", params)
+        response = await self._make_request("flight", params, cache_ttl=self.CALLSIGN_CACHE_TTL)
         
         # Parse the response
         if response and "response" in response and response["response"]:
@@ -174,7 +212,7 @@ class AirLabsAPI(AircraftTrackerAPI):
         }
         
         # Make the request
-        response = await self._make_request("flight", params)
+        response = await self._make_request("flight", params, cache_ttl=self.CALLSIGN_CACHE_TTL)
         
         # Parse the response
         if response and "response" in response and response["response"]:
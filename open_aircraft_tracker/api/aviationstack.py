@@ -2,14 +2,18 @@
 AviationStack API client implementation.
 Documentation: https://aviationstack.com/documentation
 """
-import asyncio
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, List, Optional, Any
 
-import aiohttp
-from geopy.distance import geodesic
+import numpy as np
 
-from open_aircraft_tracker.api.base import Aircraft, AircraftTrackerAPI
+from open_aircraft_tracker.api._http import AsyncTokenBucket, fetch_json
+from open_aircraft_tracker.api.base import (
+    FT_TO_M, KT_TO_MS, Aircraft, AircraftTrackerAPI, intern_string, normalize_callsign,
+    optional_float
+)
+from open_aircraft_tracker.utils.cache import TTLCache
+from open_aircraft_tracker.utils.geo import filter_within_radius
 
 
 class AviationStackAPI(AircraftTrackerAPI):
@@ -17,6 +21,10 @@ class AviationStackAPI(AircraftTrackerAPI):
     
     BASE_URL = "http://api.aviationstack.com/v1"
     
+    # Unit conversion factors for the numeric columns:
+    # latitude, longitude, altitude (feet -> meters), speed (knots -> m/s), direction
+    COLUMN_FACTORS = np.array([1.0, 1.0, FT_TO_M, KT_TO_MS, 1.0])
+    
     def __init__(self, api_key: str):
         """
         Initialize the AviationStack API client.
@@ -27,14 +35,26 @@ class AviationStackAPI(AircraftTrackerAPI):
         self.api_key = api_key
         if not api_key:
             raise ValueError("AviationStack API key is required")
+        
+        # Limit the request rate to avoid tripping the provider's rate limits
+        self._limiter = AsyncTokenBucket(max_tokens=5, refill_per_sec=1.0)
+        
+        # Reuse responses for identical requests made in quick succession
+        self._response_cache = TTLCache(maxsize=64, ttl=self.RADIUS_CACHE_TTL)
     
-    async def _make_request(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Dict:
+    async def _make_request(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        cache_ttl: Optional[float] = None
+    ) -> Dict:
         """
         Make a request to the AviationStack API.
         
         Args:
             endpoint: API endpoint
             params: Query parameters
+            cache_ttl: Seconds to reuse the response for (defaults to RADIUS_CACHE_TTL)
             
         Returns:
             JSON response as a dictionary
@@ -46,58 +66,95 @@ class AviationStackAPI(AircraftTrackerAPI):
             params = {}
         params["access_key"] = self.api_key
         
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, params=params) as response:
-                if response.status == 200:
-                    return await response.json()
-                else:
-                    response.raise_for_status()
+        return await fetch_json(
+            url,
+            params=params,
+            limiter=self._limiter,
+            cache=self._response_cache,
+            cache_ttl=cache_ttl
+        )
+    
+    def _parse_columns(self, flights: List[Dict]) -> np.ndarray:
+        """
+        Collect the numeric fields of all flights into columns and convert their units.
+        
+        Args:
+            flights: Flight data from the AviationStack API
+            
+        Returns:
+            Array with one row per flight and the columns latitude, longitude,
+            altitude (m), velocity (m/s) and heading; NaN marks missing values
+        """
+        columns = np.array(
+            [
+                (live.get("latitude"), live.get("longitude"), live.get("altitude"), live.get("speed"), live.get("direction"))
+                for live in ((flight.get("live") or {}) for flight in flights)
+            ],
+            dtype=np.float64
+        ).reshape(-1, 5)
+        
+        # Convert feet to meters and knots to m/s in one step
+        columns *= self.COLUMN_FACTORS
+        
+        return columns
     
-    def _parse_aircraft(self, flight_data: Dict) -> Aircraft:
+    def _parse_aircraft(
+        self,
+        flight_data: Dict,
+        values: Optional[np.ndarray] = None,
+        now: Optional[datetime] = None
+    ) -> Aircraft:
         """
         Parse flight data from the AviationStack API into an Aircraft object.
         
         Args:
             flight_data: Flight data from the AviationStack API
+            values: Row of converted numeric values from _parse_columns (computed if not given)
+            now: Time of the poll, used when the flight has no timestamp (defaults to the current time)
             
         Returns:
             Aircraft object
         """
+        if values is None:
+            values = self._parse_columns([flight_data])[0]
+        
         # Extract aircraft data
-        aircraft = flight_data.get("aircraft", {})
-        flight = flight_data.get("flight", {})
-        live = flight_data.get("live", {})
+        aircraft = flight_data.get("aircraft") or {}
+        flight = flight_data.get("flight") or {}
+        live = flight_data.get("live") or {}
         
         # Extract ICAO24 (transponder code)
-        icao24 = aircraft.get("icao24", "").lower()
-        if not icao24 and aircraft.get("registration"):
+        icao24 = (aircraft.get("icao24") or "").lower()
+        registration = aircraft.get("registration")
+        if not icao24 and registration:
             # Use registration as fallback if ICAO24 is not available
-            icao24 = aircraft.get("registration", "").lower()
+            icao24 = registration.lower()
         
         # Extract other fields
         callsign = flight.get("iata") or flight.get("icao") or flight.get("number", "")
-        origin_country = flight_data.get("airline", {}).get("country_name")
-        latitude = live.get("latitude")
-        longitude = live.get("longitude")
-        altitude = live.get("altitude") * 0.3048 if live.get("altitude") else None  # Convert feet to meters
-        velocity = live.get("speed") * 0.514444 if live.get("speed") else None  # Convert knots to m/s
-        heading = live.get("direction")
+        latitude, longitude, altitude, velocity, heading = (optional_float(value) for value in values)
         vertical_rate = None  # AviationStack doesn't provide vertical rate
         
-        # Use current time as last update if not provided
-        last_update = datetime.now()
+        # Use the live data timestamp (converted to naive local time) or the time of the poll if not provided,
+        # fromisoformat() only accepts a trailing "Z" from Python 3.11 on
+        last_update = now or datetime.now()
+        updated = live.get("updated")
+        if updated:
+            if updated.endswith("Z"):
+                updated = updated[:-1] + "+00:00"
+            try:
+                last_update = datetime.fromisoformat(updated).astimezone().replace(tzinfo=None)
+            except ValueError:
+                # Keep the time of the poll rather than dropping the whole query over one timestamp
+                pass
+        
+        # Intern strings that repeat heavily across aircraft and polls
+        callsign = intern_string(normalize_callsign(callsign) if callsign else callsign)
+        origin_country = intern_string((flight_data.get("airline") or {}).get("country_name"))
         
         return Aircraft(
-            icao24=icao24,
-            callsign=callsign,
-            origin_country=origin_country,
-            latitude=latitude,
-            longitude=longitude,
-            altitude=altitude,
-            velocity=velocity,
-            heading=heading,
-            vertical_rate=vertical_rate,
-            last_update=last_update
+            icao24, callsign, origin_country, latitude, longitude,
+            altitude, velocity, heading, vertical_rate, last_update
         )
     
     async def get_aircraft_in_radius(self, latitude: float, longitude: float, radius_km: float) -> List[Aircraft]:
@@ -124,33 +181,19 @@ class AviationStackAPI(AircraftTrackerAPI):
         
         # Parse the response
         aircraft_list = []
-        if response and "data" in response:
-            center = (latitude, longitude)
+        if response and response.get("data"):
+            flights = response["data"]
             
-            for flight in response["data"]:
-                # Skip flights without live data
-                if "live" not in flight or not flight["live"]:
-                    continue
-                
-                # Skip flights without position data
-                live = flight["live"]
-                if "latitude" not in live or "longitude" not in live:
-                    continue
-                
-                # Parse flight data
-                aircraft = self._parse_aircraft(flight)
-                
-                # Skip aircraft without position data
-                if aircraft.latitude is None or aircraft.longitude is None:
-                    continue
-                
-                # Calculate actual distance
-                aircraft_pos = (aircraft.latitude, aircraft.longitude)
-                distance = geodesic(center, aircraft_pos).kilometers
-                
-                # Only include aircraft within the specified radius
-                if distance <= radius_km:
-                    aircraft_list.append(aircraft)
+            # Parse all numeric fields at once (missing values become NaN)
+            columns = self._parse_columns(flights)
+            
+            # Use a single poll time for all aircraft in the response
+            now = datetime.now()
+            
+            # Only build Aircraft objects for aircraft within the specified radius
+            mask = filter_within_radius(latitude, longitude, columns[:, 0], columns[:, 1], radius_km)
+            for index in np.flatnonzero(mask):
+                aircraft_list.append(self._parse_aircraft(flights[index], columns[index], now))
         
         return aircraft_list
     
@@ -165,7 +208,7 @@ class AviationStackAPI(AircraftTrackerAPI):
             Aircraft object if found, None otherwise
         """
         # Normalize callsign
-        normalized_callsign = callsign.strip().upper()
+        normalized_callsign = normalize_callsign(callsign)
         
         # Try with IATA code
         params = {
@@ -173,7 +216,7 @@ class AviationStackAPI(AircraftTrackerAPI):
         }
         
         # Make the request
-        response = await self._make_request("flights", params)
+        response = await self._make_request("flights", params, cache_ttl=self.CALLSIGN_CACHE_TTL)
         
         # Parse the response
         if response and "data" in response and response["data"]:
@@ -190,7 +233,7 @@ class AviationStackAPI(AircraftTrackerAPI):
         }
         
         # Make the request
-        response = await self._make_request("flights", params)
+        response = await self._make_request("flights", params, cache_ttl=self.CALLSIGN_CACHE_TTL)
         
         # Parse the response
         if response and "data" in response and response["data"]:
@@ -207,7 +250,7 @@ class AviationStackAPI(AircraftTrackerAPI):
         }
         
         # Make the request
-        response = await self._make_request("flights", params)
+        response = await self._make_request("flights", params, cache_ttl=self.CALLSIGN_CACHE_TTL)
         
         # Parse the response
         if response and "data" in response and response["data"]:
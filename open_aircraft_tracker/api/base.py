@@ -2,15 +2,76 @@
 Base API client interface for aircraft tracking.
 All API implementations should inherit from this base class.
 """
+import asyncio
+import math
+import sys
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional, Sequence
 
+from open_aircraft_tracker.api._http import close_session
+from open_aircraft_tracker.utils.logging import logger
 
-@dataclass
+# Unit conversion factors to the SI units used by Aircraft
+FT_TO_M = 0.3048  # feet to meters
+KT_TO_MS = 0.514444  # knots to m/s
+FPM_TO_MS = 0.00508  # feet/min to m/s
+KMH_TO_MS = 1 / 3.6  # km/h to m/s
+
+
+def intern_string(value: Optional[str]) -> Optional[str]:
+    """
+    Intern a string so that repeated values (callsigns, countries) share one object.
+    
+    Args:
+        value: String to intern, or None
+        
+    Returns:
+        The interned string, or the value unchanged if it is not a string
+    """
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+# Translation table that upper-cases ASCII letters (callsigns are plain ASCII)
+_CALLSIGN_UPPER = str.maketrans("abcdefghijklmnopqrstuvwxyz", "ABCDEFGHIJKLMNOPQRSTUVWXYZ")
+
+
+def normalize_callsign(callsign: str) -> str:
+    """
+    Normalize a callsign for lookups by stripping whitespace and upper-casing it.
+    
+    Args:
+        callsign: Callsign as entered by the user or returned by an API
+        
+    Returns:
+        Normalized callsign
+    """
+    return callsign.strip().translate(_CALLSIGN_UPPER)
+
+
+def optional_float(value: float) -> Optional[float]:
+    """
+    Convert a numeric column value to a float, mapping NaN (missing) back to None.
+    
+    Args:
+        value: Value taken from a NumPy column
+        
+    Returns:
+        The value as a float, or None if it is NaN
+    """
+    return None if math.isnan(value) else float(value)
+
+
+@dataclass(frozen=True, slots=True)
 class Aircraft:
-    """Data class representing an aircraft."""
+    """
+    Data class representing an aircraft.
+    
+    Instances are immutable so that API clients can safely reuse them across polls.
+    API clients construct them positionally in the hot parse path, so the field
+    order below is part of the interface.
+    """
     icao24: str  # ICAO 24-bit address of the aircraft
     callsign: Optional[str]  # Callsign of the aircraft
     origin_country: Optional[str]  # Country of origin
@@ -26,6 +87,57 @@ class Aircraft:
 class AircraftTrackerAPI(ABC):
     """Base class for aircraft tracking APIs."""
     
+    # Maximum number of provider queries that run at the same time
+    MAX_CONCURRENT_QUERIES = 64
+    
+    # Seconds that responses are reused for identical radius and callsign queries
+    RADIUS_CACHE_TTL = 2.0
+    CALLSIGN_CACHE_TTL = 30.0
+    
+    @classmethod
+    async def gather_aircraft_in_radius(
+        cls,
+        clients: Sequence["AircraftTrackerAPI"],
+        latitude: float,
+        longitude: float,
+        radius_km: float
+    ) -> List[Aircraft]:
+        """
+        Query several API clients concurrently and merge their results.
+        
+        Clients that fail are logged and skipped. Aircraft reported by more than one
+        client are deduplicated by ICAO24 address, keeping the most recent report.
+        
+        Args:
+            clients: API clients to query
+            latitude: WGS-84 latitude in decimal degrees
+            longitude: WGS-84 longitude in decimal degrees
+            radius_km: Radius in kilometers
+            
+        Returns:
+            List of Aircraft objects within the specified radius
+        """
+        semaphore = asyncio.Semaphore(cls.MAX_CONCURRENT_QUERIES)
+        
+        async def query(client: "AircraftTrackerAPI") -> List[Aircraft]:
+            async with semaphore:
+                return await client.get_aircraft_in_radius(latitude, longitude, radius_km)
+        
+        results = await asyncio.gather(*(query(client) for client in clients), return_exceptions=True)
+        
+        merged: Dict[str, Aircraft] = {}
+        for client, result in zip(clients, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Error getting aircraft data from {client.__class__.__name__}: {result}")
+                continue
+            
+            for aircraft in result:
+                existing = merged.get(aircraft.icao24)
+                if existing is None or aircraft.last_update > existing.last_update:
+                    merged[aircraft.icao24] = aircraft
+        
+        return list(merged.values())
+    
     @abstractmethod
     async def get_aircraft_in_radius(self, latitude: float, longitude: float, radius_km: float) -> List[Aircraft]:
         """
@@ -53,3 +165,12 @@ class AircraftTrackerAPI(ABC):
             Aircraft object if found, None otherwise
         """
         pass
+    
+    async def aclose(self):
+        """
+        Release the network resources used by the client.
+        
+        All clients share one pooled HTTP session, so this closes that session;
+        it is recreated on the next request.
+        """
+        await close_session()
@@ -2,14 +2,19 @@
 FlightAware FlightXML API client implementation.
 Documentation: https://flightaware.com/commercial/flightxml/documentation/
 """
-import asyncio
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, List, Optional, Any
 
 import aiohttp
-from geopy.distance import geodesic
+import numpy as np
 
-from open_aircraft_tracker.api.base import Aircraft, AircraftTrackerAPI
+from open_aircraft_tracker.api._http import AsyncTokenBucket, fetch_json
+from open_aircraft_tracker.api.base import (
+    FPM_TO_MS, FT_TO_M, KT_TO_MS, Aircraft, AircraftTrackerAPI, intern_string,
+    normalize_callsign, optional_float
+)
+from open_aircraft_tracker.utils.cache import TTLCache
+from open_aircraft_tracker.utils.geo import filter_within_radius
 
 
 class FlightAwareAPI(AircraftTrackerAPI):
@@ -17,6 +22,11 @@ class FlightAwareAPI(AircraftTrackerAPI):
     
     BASE_URL = "https://flightxml.flightaware.com/json/FlightXML3"
     
+    # Unit conversion factors for the numeric columns:
+    # latitude, longitude, altitude (feet -> meters), groundspeed (knots -> m/s), heading,
+    # vertical_speed (feet/min -> m/s)
+    COLUMN_FACTORS = np.array([1.0, 1.0, FT_TO_M, KT_TO_MS, 1.0, FPM_TO_MS])
+    
     def __init__(self, username: str, api_key: str):
         """
         Initialize the FlightAware API client.
@@ -32,69 +42,108 @@ class FlightAwareAPI(AircraftTrackerAPI):
             raise ValueError("FlightAware API requires both username and API key")
         
         self.auth = aiohttp.BasicAuth(username, api_key)
+        
+        # Limit the request rate to avoid tripping the provider's rate limits
+        self._limiter = AsyncTokenBucket(max_tokens=5, refill_per_sec=1.0)
+        
+        # Reuse responses for identical requests made in quick succession
+        self._response_cache = TTLCache(maxsize=64, ttl=self.RADIUS_CACHE_TTL)
     
-    async def _make_request(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Dict:
+    async def _make_request(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        cache_ttl: Optional[float] = None
+    ) -> Dict:
         """
         Make a request to the FlightAware API.
         
         Args:
             endpoint: API endpoint
             params: Query parameters
+            cache_ttl: Seconds to reuse the response for (defaults to RADIUS_CACHE_TTL)
             
         Returns:
             JSON response as a dictionary
         """
         url = f"{self.BASE_URL}/{endpoint}"
         
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, params=params, auth=self.auth) as response:
-                if response.status == 200:
-                    return await response.json()
-                else:
-                    response.raise_for_status()
+        return await fetch_json(
+            url,
+            params=params,
+            auth=self.auth,
+            limiter=self._limiter,
+            cache=self._response_cache,
+            cache_ttl=cache_ttl
+        )
     
-    def _parse_aircraft(self, flight_data: Dict) -> Aircraft:
+    def _parse_columns(self, flights: List[Dict]) -> np.ndarray:
+        """
+        Collect the numeric fields of all flights into columns and convert their units.
+        
+        Args:
+            flights: Flight data from the FlightAware API
+            
+        Returns:
+            Array with one row per flight and the columns latitude, longitude,
+            altitude (m), velocity (m/s), heading and vertical rate (m/s); NaN marks missing values
+        """
+        columns = np.array(
+            [
+                (position.get("latitude"), position.get("longitude"), position.get("altitude"),
+                 position.get("groundspeed"), position.get("heading"), position.get("vertical_speed"))
+                for position in ((flight.get("last_position") or {}) for flight in flights)
+            ],
+            dtype=np.float64
+        ).reshape(-1, 6)
+        
+        # Convert feet to meters, knots to m/s and feet/min to m/s in one step
+        columns *= self.COLUMN_FACTORS
+        
+        return columns
+    
+    def _parse_aircraft(
+        self,
+        flight_data: Dict,
+        values: Optional[np.ndarray] = None,
+        now: Optional[datetime] = None
+    ) -> Aircraft:
         """
         Parse flight data from the FlightAware API into an Aircraft object.
         
         Args:
             flight_data: Flight data from the FlightAware API
+            values: Row of converted numeric values from _parse_columns (computed if not given)
+            now: Time of the poll, used when the flight has no timestamp (defaults to the current time)
             
         Returns:
             Aircraft object
         """
+        if values is None:
+            values = self._parse_columns([flight_data])[0]
+        
         # Extract data from the FlightAware response
-        position = flight_data.get("last_position", {})
-        flight_info = flight_data.get("flight", {})
+        position = flight_data.get("last_position") or {}
+        flight_info = flight_data.get("flight") or {}
         
         # Extract ICAO24 (hex identifier)
         icao24 = flight_data.get("hex_ident", "").lower()
         
         # Extract other fields
         callsign = flight_info.get("ident", "")
-        origin_country = flight_info.get("origin", {}).get("country_name")
-        latitude = position.get("latitude")
-        longitude = position.get("longitude")
-        altitude = position.get("altitude") * 0.3048 if position.get("altitude") else None  # Convert feet to meters
-        velocity = position.get("groundspeed") * 0.514444 if position.get("groundspeed") else None  # Convert knots to m/s
-        heading = position.get("heading")
-        vertical_rate = position.get("vertical_speed") * 0.00508 if position.get("vertical_speed") else None  # Convert feet/min to m/s
-        
-        # Use timestamp from position data or current time
+        latitude, longitude, altitude, velocity, heading, vertical_rate = (optional_float(value) for value in values)
+        
+        # Use timestamp from position data or the time of the poll
         timestamp = position.get("timestamp", 0)
-        last_update = datetime.fromtimestamp(timestamp) if timestamp else datetime.now()
+        last_update = datetime.fromtimestamp(timestamp) if timestamp else (now or datetime.now())
+        
+        # Intern strings that repeat heavily across aircraft and polls
+        callsign = intern_string(normalize_callsign(callsign) if callsign else callsign)
+        origin_country = intern_string((flight_info.get("origin") or {}).get("country_name"))
         
         return Aircraft(
-            icao24=icao24,
-            callsign=callsign,
-            origin_country=origin_country,
-            latitude=latitude,
-            longitude=longitude,
-            altitude=altitude,
-            velocity=velocity,
-            heading=heading,
-            vertical_rate=vertical_rate,
-            last_update=last_update
+            icao24, callsign, origin_country, latitude, longitude,
+            altitude, velocity, heading, vertical_rate, last_update
         )
     
     async def get_aircraft_in_radius(self, latitude: float, longitude: float, radius_km: float) -> List[Aircraft]:
@@ -126,24 +175,19 @@ class FlightAwareAPI(AircraftTrackerAPI):
         aircraft_list = []
         if response and "SearchBirdseyeInFlightResult" in response:
             result = response["SearchBirdseyeInFlightResult"]
-            if "aircraft" in result:
-                center = (latitude, longitude)
+            if result.get("aircraft"):
+                flights = result["aircraft"]
+                
+                # Parse all numeric fields at once (missing values become NaN)
+                columns = self._parse_columns(flights)
                 
-                for flight in result["aircraft"]:
-                    # Parse flight data
-                    aircraft = self._parse_aircraft(flight)
-                    
-                    # Skip aircraft without position data
-                    if aircraft.latitude is None or aircraft.longitude is None:
-                        continue
-                    
-                    # Calculate actual distance
-                    aircraft_pos = (aircraft.latitude, aircraft.longitude)
-                    distance = geodesic(center, aircraft_pos).kilometers
-                    
-                    # Only include aircraft within the specified radius
-                    if distance <= radius_km:
-                        aircraft_list.append(aircraft)
+                # Use a single poll time for all aircraft in the response
+                now = datetime.now()
+                
+                # Only build Aircraft objects for aircraft within the specified radius
+                mask = filter_within_radius(latitude, longitude, columns[:, 0], columns[:, 1], radius_km)
+                for index in np.flatnonzero(mask):
+                    aircraft_list.append(self._parse_aircraft(flights[index], columns[index], now))
         
         return aircraft_list
     
@@ -158,7 +202,7 @@ class FlightAwareAPI(AircraftTrackerAPI):
             Aircraft object if found, None otherwise
         """
         # Normalize callsign
-        normalized_callsign = callsign.strip().upper()
+        normalized_callsign = normalize_callsign(callsign)
         
         # Query parameters for the search
         params = {
@@ -167,7 +211,7 @@ class FlightAwareAPI(AircraftTrackerAPI):
         }
         
         # Make the request to the SearchBirdseyeInFlight endpoint
-        response = await self._make_request("SearchBirdseyeInFlight", params)
+        response = await self._make_request("SearchBirdseyeInFlight", params, cache_ttl=self.CALLSIGN_CACHE_TTL)
         
         # Parse the response
         if response and "SearchBirdseyeInFlightResult" in response:
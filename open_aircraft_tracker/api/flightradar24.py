@@ -2,21 +2,28 @@
 FlightRadar24 API client implementation.
 Note: This uses the unofficial API endpoints as FlightRadar24 doesn't have a fully public API.
 """
-import asyncio
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, List, Optional, Any
 import math
 
-import aiohttp
-from geopy.distance import geodesic
+import numpy as np
 
-from open_aircraft_tracker.api.base import Aircraft, AircraftTrackerAPI
+from open_aircraft_tracker.api._http import fetch_json
+from open_aircraft_tracker.api.base import (
+    FPM_TO_MS, FT_TO_M, KMH_TO_MS, KT_TO_MS, Aircraft, AircraftTrackerAPI,
+    intern_string, normalize_callsign
+)
+from open_aircraft_tracker.utils.geo import filter_within_radius
 
 
 class FlightRadar24API(AircraftTrackerAPI):
     """FlightRadar24 API client."""
     
     BASE_URL = "https://data-live.flightradar24.com/zones/fcgi/feed.js"
+    
+    # Flight entries in feed.js are keyed by 8-character hex flight IDs, everything else
+    # (full_count, version, stats, ...) is metadata
+    FLIGHT_ID_LENGTH = 8
     AIRCRAFT_URL = "https://data-live.flightradar24.com/clickhandler/"
     
     def __init__(self, api_key: str):
@@ -48,19 +55,16 @@ class FlightRadar24API(AircraftTrackerAPI):
         # Add API key to parameters
         params["apiKey"] = self.api_key
         
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, params=params) as response:
-                if response.status == 200:
-                    return await response.json()
-                else:
-                    response.raise_for_status()
+        # feed.js responses are large, fetch_json decodes them with orjson
+        return await fetch_json(url, params=params)
     
-    def _parse_aircraft(self, flight_data: Dict) -> Aircraft:
+    def _parse_aircraft(self, flight_data: Dict, now: Optional[datetime] = None) -> Aircraft:
         """
         Parse flight data from the FlightRadar24 API into an Aircraft object.
         
         Args:
             flight_data: Flight data from the FlightRadar24 API
+            now: Time of the poll, used when the flight has no timestamp (defaults to the current time)
             
         Returns:
             Aircraft object
@@ -73,18 +77,19 @@ class FlightRadar24API(AircraftTrackerAPI):
             icao24 = aircraft_data.get("hex", "").lower()
             
             # Extract other fields
-            callsign = aircraft_data.get("identification", {}).get("callsign", "")
+            callsign = normalize_callsign(aircraft_data.get("identification", {}).get("callsign") or "")
             origin_country = aircraft_data.get("airline", {}).get("country", "")
             latitude = aircraft_data.get("latitude")
             longitude = aircraft_data.get("longitude")
             altitude = aircraft_data.get("altitude", {}).get("meters")
-            velocity = aircraft_data.get("speed", {}).get("kmh") / 3.6 if aircraft_data.get("speed", {}).get("kmh") else None  # Convert km/h to m/s
+            speed_kmh = aircraft_data.get("speed", {}).get("kmh")
+            velocity = speed_kmh * KMH_TO_MS if speed_kmh is not None else None  # Convert km/h to m/s
             heading = aircraft_data.get("heading")
             vertical_rate = aircraft_data.get("verticalSpeed", {}).get("ms")  # Already in m/s
             
             # Use timestamp or current time
             timestamp = aircraft_data.get("time", 0)
-            last_update = datetime.fromtimestamp(timestamp) if timestamp else datetime.now()
+            last_update = datetime.fromtimestamp(timestamp) if timestamp else (now or datetime.now())
         
         # For basic aircraft data (from feed.js endpoint)
         else:
@@ -94,34 +99,27 @@ class FlightRadar24API(AircraftTrackerAPI):
             # [9]: Timestamp, [10]: Origin airport IATA, [11]: Destination airport IATA,
             # [12]: Flight number, [13]: Vertical speed (feet/min), [14]: Squawk
             
+            # Unpack all fields at once (the feed returns a list, older responses used index keys)
+            raw = flight_data if isinstance(flight_data, list) else [flight_data.get(i) for i in range(15)]
+            (icao24, latitude, longitude, heading, alt_ft, speed_kt, callsign,
+             _, _, timestamp, _, _, _, rate_fpm, _) = (list(raw) + [None] * 15)[:15]
+            
             # Extract ICAO24 (hex identifier)
-            icao24 = str(flight_data.get(0, "")).lower()
+            icao24 = str(icao24 or "").lower()
             
             # Extract other fields
-            latitude = flight_data.get(1)
-            longitude = flight_data.get(2)
-            heading = flight_data.get(3)
-            altitude = flight_data.get(4) * 0.3048 if flight_data.get(4) else None  # Convert feet to meters
-            velocity = flight_data.get(5) * 0.514444 if flight_data.get(5) else None  # Convert knots to m/s
-            callsign = flight_data.get(6, "")
+            altitude = alt_ft * FT_TO_M if alt_ft is not None else None  # Convert feet to meters
+            velocity = speed_kt * KT_TO_MS if speed_kt is not None else None  # Convert knots to m/s
+            callsign = normalize_callsign(callsign or "")
             origin_country = None  # Not available in basic data
-            vertical_rate = flight_data.get(13) * 0.00508 if flight_data.get(13) else None  # Convert feet/min to m/s
+            vertical_rate = rate_fpm * FPM_TO_MS if rate_fpm is not None else None  # Convert feet/min to m/s
             
             # Use timestamp or current time
-            timestamp = flight_data.get(9, 0)
-            last_update = datetime.fromtimestamp(timestamp) if timestamp else datetime.now()
+            last_update = datetime.fromtimestamp(timestamp) if timestamp else (now or datetime.now())
         
         return Aircraft(
-            icao24=icao24,
-            callsign=callsign,
-            origin_country=origin_country,
-            latitude=latitude,
-            longitude=longitude,
-            altitude=altitude,
-            velocity=velocity,
-            heading=heading,
-            vertical_rate=vertical_rate,
-            last_update=last_update
+            icao24, intern_string(callsign), intern_string(origin_country), latitude, longitude,
+            altitude, velocity, heading, vertical_rate, last_update
         )
     
     async def get_aircraft_in_radius(self, latitude: float, longitude: float, radius_km: float) -> List[Aircraft]:
@@ -176,25 +174,21 @@ class FlightRadar24API(AircraftTrackerAPI):
         # Parse the response
         aircraft_list = []
         if response:
-            center = (latitude, longitude)
+            # Use a single poll time for all aircraft in the response
+            now = datetime.now()
             
-            # Filter out metadata fields (they start with underscore)
-            for key, value in response.items():
-                if not key.startswith("_") and isinstance(value, (list, dict)):
-                    # Parse flight data
-                    aircraft = self._parse_aircraft(value)
-                    
-                    # Skip aircraft without position data
-                    if aircraft.latitude is None or aircraft.longitude is None:
-                        continue
-                    
-                    # Calculate actual distance
-                    aircraft_pos = (aircraft.latitude, aircraft.longitude)
-                    distance = geodesic(center, aircraft_pos).kilometers
-                    
-                    # Only include aircraft within the specified radius
-                    if distance <= radius_km:
-                        aircraft_list.append(aircraft)
+            # Filter out metadata fields
+            parsed = [
+                self._parse_aircraft(value, now)
+                for key, value in response.items()
+                if len(key) == self.FLIGHT_ID_LENGTH
+            ]
+            
+            # Filter by distance in a single vectorized pass (missing positions become NaN)
+            lats = np.array([aircraft.latitude for aircraft in parsed], dtype=np.float64)
+            lons = np.array([aircraft.longitude for aircraft in parsed], dtype=np.float64)
+            mask = filter_within_radius(latitude, longitude, lats, lons, radius_km)
+            aircraft_list = [aircraft for aircraft, keep in zip(parsed, mask) if keep]
         
         return aircraft_list
     
@@ -209,7 +203,7 @@ class FlightRadar24API(AircraftTrackerAPI):
             Aircraft object if found, None otherwise
         """
         # Normalize callsign
-        normalized_callsign = callsign.strip().upper()
+        normalized_callsign = normalize_callsign(callsign)
         
         # First, we need to search for the aircraft to get its ID
         # Query parameters for the search (use a large bounding box to find the aircraft)
@@ -236,10 +230,9 @@ class FlightRadar24API(AircraftTrackerAPI):
         aircraft_id = None
         if response:
             for key, value in response.items():
-                if not key.startswith("_") and isinstance(value, (list, dict)):
-                    if isinstance(value, list) and len(value) > 6 and value[6] == normalized_callsign:
-                        aircraft_id = key
-                        break
+                if len(key) == self.FLIGHT_ID_LENGTH and len(value) > 6 and value[6] == normalized_callsign:
+                    aircraft_id = key
+                    break
         
         # If we found the aircraft, get detailed information
         if aircraft_id:
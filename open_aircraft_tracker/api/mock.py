@@ -5,12 +5,13 @@ Generates simulated aircraft data without making actual API calls.
 import asyncio
 import math
 import random
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Set
+from datetime import datetime
+from typing import Dict, List, Optional
 
-from geopy.distance import geodesic
+import numpy as np
 
-from open_aircraft_tracker.api.base import Aircraft, AircraftTrackerAPI
+from open_aircraft_tracker.api.base import Aircraft, AircraftTrackerAPI, normalize_callsign
+from open_aircraft_tracker.utils.geo import filter_within_radius, haversine_km
 
 
 class MockAPI(AircraftTrackerAPI):
@@ -28,13 +29,74 @@ class MockAPI(AircraftTrackerAPI):
             seed: Random seed for reproducible results
         """
         self.num_aircraft = num_aircraft
-        self.aircraft_cache: Dict[str, Aircraft] = {}
         self.last_update = datetime.now()
         
+        # Simulated aircraft are stored as a structure of arrays, one entry per aircraft,
+        # so that all positions can be advanced with a few vectorized operations
+        self._icao24s: List[str] = []
+        self._callsigns: List[str] = []
+        self._index: Dict[str, int] = {}
+        self._callsign_index: Dict[str, int] = {}  # Normalized callsign to array index
+        self._lats = np.empty(0)
+        self._lons = np.empty(0)
+        self._altitudes = np.empty(0)
+        self._velocities = np.empty(0)
+        self._headings = np.empty(0)
+        self._vertical_rates = np.empty(0)
+        
+        # Aircraft objects built since the last position update, by array index
+        self._built: Dict[int, Aircraft] = {}
+        
         # Set random seed if provided
         if seed is not None:
             random.seed(seed)
     
+    @property
+    def aircraft_cache(self) -> Dict[str, Aircraft]:
+        """Simulated aircraft by ICAO24 address."""
+        return {icao24: self._build_aircraft(i) for i, icao24 in enumerate(self._icao24s)}
+    
+    def _build_aircraft(self, i: int) -> Aircraft:
+        """
+        Build an Aircraft object from one entry of the simulation arrays.
+        
+        Objects are only built on demand and reused until the next position update.
+        
+        Args:
+            i: Index of the aircraft in the arrays
+            
+        Returns:
+            Aircraft object
+        """
+        aircraft = self._built.get(i)
+        if aircraft is None:
+            aircraft = self._built[i] = Aircraft(
+                self._icao24s[i], self._callsigns[i], "Mock Country",
+                float(self._lats[i]), float(self._lons[i]), float(self._altitudes[i]),
+                float(self._velocities[i]), float(self._headings[i]), float(self._vertical_rates[i]),
+                self.last_update
+            )
+        
+        return aircraft
+    
+    def _keep_aircraft(self, mask: np.ndarray):
+        """
+        Keep only the aircraft selected by a mask and drop the others.
+        
+        Args:
+            mask: Boolean array, True for aircraft to keep
+        """
+        self._icao24s = [icao24 for icao24, keep in zip(self._icao24s, mask) if keep]
+        self._callsigns = [callsign for callsign, keep in zip(self._callsigns, mask) if keep]
+        self._index = {icao24: i for i, icao24 in enumerate(self._icao24s)}
+        self._callsign_index = {normalize_callsign(callsign): i for i, callsign in enumerate(self._callsigns)}
+        self._lats = self._lats[mask]
+        self._lons = self._lons[mask]
+        self._altitudes = self._altitudes[mask]
+        self._velocities = self._velocities[mask]
+        self._headings = self._headings[mask]
+        self._vertical_rates = self._vertical_rates[mask]
+    
     def _generate_callsign(self) -> str:
         """Generate a random airline callsign."""
         airline = random.choice(self.AIRLINES)
@@ -43,7 +105,8 @@ class MockAPI(AircraftTrackerAPI):
     
     def _generate_icao24(self) -> str:
         """Generate a random ICAO 24-bit address."""
-        return ''.join(random.choices('0123456789abcdef', k=6))
+        # One draw from the seeded generator instead of six, so results stay reproducible
+        return f"{random.getrandbits(24):06x}"
     
     def _update_aircraft_positions(self, center_lat: float, center_lon: float, max_radius_km: float):
         """
@@ -54,98 +117,62 @@ class MockAPI(AircraftTrackerAPI):
             center_lon: Center longitude for generating new aircraft
             max_radius_km: Maximum radius for generating new aircraft
         """
+        # Positions are advanced by the time elapsed since the last update, so they move
+        # consistently however often the API is polled
         current_time = datetime.now()
         time_diff = (current_time - self.last_update).total_seconds()
         
-        # Don't update if less than 1 second has passed
-        if time_diff < 1:
-            return
+        # km per degree around the center, aircraft stay close enough to it for this to be accurate
+        lat_km = 110.574  # km per degree of latitude
+        lon_km = 111.320 * math.cos(math.radians(center_lat))  # km per degree of longitude
         
-        # Update existing aircraft positions
-        for icao24, aircraft in list(self.aircraft_cache.items()):
-            # Skip aircraft without position or velocity data
-            if (aircraft.latitude is None or aircraft.longitude is None or 
-                aircraft.heading is None or aircraft.velocity is None):
-                continue
-            
-            # Calculate new position based on heading and velocity
-            # Convert velocity from m/s to km/h
-            velocity_kmh = aircraft.velocity * 3.6
-            
-            # Calculate distance traveled in km
-            distance_km = velocity_kmh * time_diff / 3600
-            
-            # Calculate new position
-            # This is a simplified calculation that doesn't account for Earth's curvature
-            # For more accuracy, we would use the haversine formula
-            heading_rad = math.radians(aircraft.heading)
-            lat_km = 110.574  # km per degree of latitude
-            lon_km = 111.320 * math.cos(math.radians(aircraft.latitude))  # km per degree of longitude
-            
-            new_lat = aircraft.latitude + (distance_km * math.cos(heading_rad)) / lat_km
-            new_lon = aircraft.longitude + (distance_km * math.sin(heading_rad)) / lon_km
-            
-            # Update aircraft position
-            self.aircraft_cache[icao24] = Aircraft(
-                icao24=aircraft.icao24,
-                callsign=aircraft.callsign,
-                origin_country=aircraft.origin_country,
-                latitude=new_lat,
-                longitude=new_lon,
-                altitude=aircraft.altitude,
-                velocity=aircraft.velocity,
-                heading=aircraft.heading,
-                vertical_rate=aircraft.vertical_rate,
-                last_update=current_time
-            )
-            
-            # Remove aircraft that are too far from the center
-            aircraft_pos = (new_lat, new_lon)
-            center_pos = (center_lat, center_lon)
-            distance = geodesic(center_pos, aircraft_pos).kilometers
-            
-            if distance > max_radius_km * 2:
-                del self.aircraft_cache[icao24]
+        # Advance all aircraft along their heading
+        # This is a simplified calculation that doesn't account for Earth's curvature
+        distance_km = self._velocities * (time_diff / 1000)  # velocity is in m/s
+        heading_rad = np.radians(self._headings)
+        self._lats += distance_km * np.cos(heading_rad) / lat_km
+        self._lons += distance_km * np.sin(heading_rad) / lon_km
+        
+        # Remove aircraft that are too far from the center
+        self._keep_aircraft(haversine_km(center_lat, center_lon, self._lats, self._lons) <= max_radius_km * 2)
         
         # Generate new aircraft if needed
-        while len(self.aircraft_cache) < self.num_aircraft:
+        new_aircraft = []
+        while len(self._icao24s) + len(new_aircraft) < self.num_aircraft:
             # Generate a random position within the maximum radius
             distance = random.uniform(max_radius_km * 0.8, max_radius_km * 1.5)
-            bearing = random.uniform(0, 360)
-            
-            # Convert bearing to radians
-            bearing_rad = math.radians(bearing)
-            
-            # Calculate new position
-            lat_km = 110.574  # km per degree of latitude
-            lon_km = 111.320 * math.cos(math.radians(center_lat))  # km per degree of longitude
-            
-            new_lat = center_lat + (distance * math.cos(bearing_rad)) / lat_km
-            new_lon = center_lon + (distance * math.sin(bearing_rad)) / lon_km
-            
-            # Generate random aircraft data
-            icao24 = self._generate_icao24()
-            callsign = self._generate_callsign()
-            altitude = random.uniform(3000, 12000)  # meters
-            velocity = random.uniform(200, 300)  # m/s
-            heading = random.uniform(0, 360)  # degrees
-            vertical_rate = random.uniform(-5, 5)  # m/s
-            
-            # Add aircraft to cache
-            self.aircraft_cache[icao24] = Aircraft(
-                icao24=icao24,
-                callsign=callsign,
-                origin_country="Mock Country",
-                latitude=new_lat,
-                longitude=new_lon,
-                altitude=altitude,
-                velocity=velocity,
-                heading=heading,
-                vertical_rate=vertical_rate,
-                last_update=current_time
-            )
+            bearing_rad = math.radians(random.uniform(0, 360))
+            
+            new_aircraft.append((
+                self._generate_icao24(),
+                self._generate_callsign(),
+                center_lat + (distance * math.cos(bearing_rad)) / lat_km,
+                center_lon + (distance * math.sin(bearing_rad)) / lon_km,
+                random.uniform(3000, 12000),  # altitude in meters
+                random.uniform(200, 300),  # velocity in m/s
+                random.uniform(0, 360),  # heading in degrees
+                random.uniform(-5, 5)  # vertical rate in m/s
+            ))
+        
+        # Append the new aircraft to the arrays in one step
+        if new_aircraft:
+            icao24s, callsigns, lats, lons, altitudes, velocities, headings, vertical_rates = zip(*new_aircraft)
+            for icao24, callsign in zip(icao24s, callsigns):
+                self._index[icao24] = len(self._icao24s)
+                self._callsign_index[normalize_callsign(callsign)] = len(self._icao24s)
+                self._icao24s.append(icao24)
+                self._callsigns.append(callsign)
+            self._lats = np.concatenate((self._lats, lats))
+            self._lons = np.concatenate((self._lons, lons))
+            self._altitudes = np.concatenate((self._altitudes, altitudes))
+            self._velocities = np.concatenate((self._velocities, velocities))
+            self._headings = np.concatenate((self._headings, headings))
+            self._vertical_rates = np.concatenate((self._vertical_rates, vertical_rates))
         
         self.last_update = current_time
+        
+        # Positions and indices changed, so previously built objects are stale
+        self._built.clear()
     
     async def get_aircraft_in_radius(self, latitude: float, longitude: float, radius_km: float) -> List[Aircraft]:
         """
@@ -162,22 +189,9 @@ class MockAPI(AircraftTrackerAPI):
         # Update aircraft positions
         self._update_aircraft_positions(latitude, longitude, radius_km * 3)
         
-        # Filter aircraft by distance
-        result = []
-        center = (latitude, longitude)
-        
-        for aircraft in self.aircraft_cache.values():
-            # Skip aircraft without position data
-            if aircraft.latitude is None or aircraft.longitude is None:
-                continue
-            
-            # Calculate distance
-            aircraft_pos = (aircraft.latitude, aircraft.longitude)
-            distance = geodesic(center, aircraft_pos).kilometers
-            
-            # Only include aircraft within the specified radius
-            if distance <= radius_km:
-                result.append(aircraft)
+        # Filter aircraft by distance and only build Aircraft objects for those within the radius
+        mask = filter_within_radius(latitude, longitude, self._lats, self._lons, radius_km)
+        result = [self._build_aircraft(i) for i in np.flatnonzero(mask)]
         
         # Simulate network delay
         await asyncio.sleep(0.2)
@@ -195,12 +209,12 @@ class MockAPI(AircraftTrackerAPI):
             Aircraft object if found, None otherwise
         """
         # Normalize callsign
-        normalized_callsign = callsign.strip().upper()
+        normalized_callsign = normalize_callsign(callsign)
         
-        # Search for aircraft with matching callsign
-        for aircraft in self.aircraft_cache.values():
-            if aircraft.callsign and aircraft.callsign.strip().upper() == normalized_callsign:
-                return aircraft
+        # Look up the aircraft with matching callsign
+        index = self._callsign_index.get(normalized_callsign)
+        if index is not None:
+            return self._build_aircraft(index)
         
         # Simulate network delay
         await asyncio.sleep(0.2)
@@ -2,14 +2,54 @@
 OpenSky Network API client implementation.
 Documentation: https://openskynetwork.github.io/opensky-api/rest.html
 """
-import asyncio
+import functools
+import math
+import operator
+import time
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple, Any
 
 import aiohttp
-from geopy.distance import geodesic
+import numpy as np
 
-from open_aircraft_tracker.api.base import Aircraft, AircraftTrackerAPI
+from open_aircraft_tracker.api._http import fetch_json
+from open_aircraft_tracker.api.base import Aircraft, AircraftTrackerAPI, intern_string, normalize_callsign
+from open_aircraft_tracker.utils.cache import TTLCache
+from open_aircraft_tracker.utils.geo import filter_within_radius
+
+# Picks icao24, callsign, origin_country, longitude, latitude, baro_altitude, velocity,
+# true_track and vertical_rate out of a state vector in one call
+_STATE_FIELDS = operator.itemgetter(0, 1, 2, 5, 6, 7, 9, 10, 11)
+
+
+@functools.lru_cache(maxsize=32)
+def _bbox(latitude: float, longitude: float, radius_km: float) -> Tuple[float, float, float, float]:
+    """
+    Calculate a bounding box around a location for the "states/all" query.
+    
+    The tracker polls from a fixed location, so the result is memoized.
+    
+    Args:
+        latitude: WGS-84 latitude in decimal degrees
+        longitude: WGS-84 longitude in decimal degrees
+        radius_km: Radius in kilometers
+        
+    Returns:
+        Tuple of (lamin, lamax, lomin, lomax), rounded outwards to 2 decimals so that
+        repeated polls of the same area share cached responses
+    """
+    lat_km = 110.574  # km per degree of latitude
+    lon_km = max(111.320 * math.cos(math.radians(latitude)), 1e-6)  # km per degree of longitude
+    
+    lat_diff = radius_km / lat_km
+    lon_diff = radius_km / lon_km
+    
+    return (
+        math.floor((latitude - lat_diff) * 100) / 100,
+        math.ceil((latitude + lat_diff) * 100) / 100,
+        math.floor((longitude - lon_diff) * 100) / 100,
+        math.ceil((longitude + lon_diff) * 100) / 100
+    )
 
 
 class OpenSkyAPI(AircraftTrackerAPI):
@@ -17,6 +57,11 @@ class OpenSkyAPI(AircraftTrackerAPI):
     
     BASE_URL = "https://opensky-network.org/api"
     
+    # OpenSky updates state vectors every 5 seconds for authenticated users and every 10 seconds
+    # for anonymous users, so newer responses can't contain newer data
+    STATES_CACHE_TTL = 5.0
+    ANONYMOUS_STATES_CACHE_TTL = 10.0
+    
     def __init__(self, username: Optional[str] = None, password: Optional[str] = None):
         """
         Initialize the OpenSky API client.
@@ -30,6 +75,19 @@ class OpenSkyAPI(AircraftTrackerAPI):
         self.auth = None
         if username and password:
             self.auth = aiohttp.BasicAuth(username, password)
+        
+        # Reuse "states/all" responses per bounding box (and for the whole world) for as long as
+        # OpenSky can't have newer data, which also saves anonymous users' API credits
+        self.states_ttl = self.STATES_CACHE_TTL if self.auth else self.ANONYMOUS_STATES_CACHE_TTL
+        self._states_cache = TTLCache(maxsize=16, ttl=self.states_ttl)
+        
+        # Latest radius response as (monotonic time, state vectors, response time), so callsign
+        # lookups can find aircraft that were just polled without fetching the whole world
+        self._last_states: Optional[Tuple[float, List, datetime]] = None
+        
+        # Result of the latest radius query as (state vectors, query, aircraft list), reused while
+        # the cache keeps returning the same response, since none of the positions can have changed
+        self._last_result: Optional[Tuple[List, Tuple[float, float, float], List[Aircraft]]] = None
     
     async def _make_request(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Dict:
         """
@@ -44,35 +102,32 @@ class OpenSkyAPI(AircraftTrackerAPI):
         """
         url = f"{self.BASE_URL}/{endpoint}"
         
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, params=params, auth=self.auth) as response:
-                if response.status == 200:
-                    return await response.json()
-                else:
-                    response.raise_for_status()
+        return await fetch_json(url, params=params, auth=self.auth, cache=self._states_cache)
     
-    def _parse_state_vector(self, state_vector: List, time_position: int) -> Aircraft:
+    def _parse_state_vector(self, state_vector: List, last_update: datetime) -> Aircraft:
         """
         Parse a state vector from the OpenSky API into an Aircraft object.
         
         Args:
             state_vector: State vector from the OpenSky API
-            time_position: Time of the position in seconds since epoch
+            last_update: Time of the response the state vector belongs to
             
         Returns:
             Aircraft object
         """
+        icao24, callsign, origin_country, longitude, latitude, altitude, velocity, heading, vertical_rate = _STATE_FIELDS(state_vector)
+        
         return Aircraft(
-            icao24=state_vector[0],
-            callsign=state_vector[1].strip() if state_vector[1] else None,
-            origin_country=state_vector[2],
-            latitude=state_vector[6],
-            longitude=state_vector[5],
-            altitude=state_vector[7],
-            velocity=state_vector[9],
-            heading=state_vector[10],
-            vertical_rate=state_vector[11],
-            last_update=datetime.fromtimestamp(time_position or 0)
+            icao24,
+            intern_string(normalize_callsign(callsign)) if callsign else None,
+            intern_string(origin_country),
+            latitude,
+            longitude,
+            altitude,
+            velocity,
+            heading,
+            vertical_rate,
+            last_update
         )
     
     async def get_aircraft_in_radius(self, latitude: float, longitude: float, radius_km: float) -> List[Aircraft]:
@@ -90,18 +145,14 @@ class OpenSkyAPI(AircraftTrackerAPI):
         # Calculate bounding box for the query
         # This is an approximation to reduce the number of results
         # We'll filter more precisely using the actual distance later
-        lat_km = 110.574  # km per degree of latitude
-        lon_km = 111.320 * abs(float(latitude))  # km per degree of longitude
-        
-        lat_diff = radius_km / lat_km
-        lon_diff = radius_km / lon_km
+        lamin, lamax, lomin, lomax = _bbox(latitude, longitude, radius_km)
         
         # Query parameters for the bounding box
         params = {
-            "lamin": latitude - lat_diff,
-            "lamax": latitude + lat_diff,
-            "lomin": longitude - lon_diff,
-            "lomax": longitude + lon_diff
+            "lamin": lamin,
+            "lamax": lamax,
+            "lomin": lomin,
+            "lomax": lomax
         }
         
         # Make the request
@@ -110,23 +161,24 @@ class OpenSkyAPI(AircraftTrackerAPI):
         # Parse the response
         aircraft_list = []
         if response and "states" in response and response["states"]:
-            center = (latitude, longitude)
-            time_position = response.get("time", 0)
+            states = response["states"]
+            query = (latitude, longitude, radius_km)
+            if self._last_result is not None and self._last_result[0] is states and self._last_result[1] == query:
+                return list(self._last_result[2])
+            
+            # All state vectors of a response share its timestamp, so convert it only once
+            last_update = datetime.fromtimestamp(response.get("time") or 0)
+            if self._last_states is None or self._last_states[1] is not states:
+                self._last_states = (time.monotonic(), states, last_update)
+            parsed = [self._parse_state_vector(state, last_update) for state in states]
             
-            for state in response["states"]:
-                aircraft = self._parse_state_vector(state, time_position)
-                
-                # Skip aircraft without position data
-                if aircraft.latitude is None or aircraft.longitude is None:
-                    continue
-                
-                # Calculate actual distance
-                aircraft_pos = (aircraft.latitude, aircraft.longitude)
-                distance = geodesic(center, aircraft_pos).kilometers
-                
-                # Only include aircraft within the specified radius
-                if distance <= radius_km:
-                    aircraft_list.append(aircraft)
+            # Filter by distance in a single vectorized pass (missing positions become NaN)
+            lats = np.array([aircraft.latitude for aircraft in parsed], dtype=np.float64)
+            lons = np.array([aircraft.longitude for aircraft in parsed], dtype=np.float64)
+            mask = filter_within_radius(latitude, longitude, lats, lons, radius_km)
+            aircraft_list = [aircraft for aircraft, keep in zip(parsed, mask) if keep]
+            self._last_result = (states, query, aircraft_list)
+            aircraft_list = list(aircraft_list)
         
         return aircraft_list
     
@@ -141,16 +193,39 @@ class OpenSkyAPI(AircraftTrackerAPI):
             Aircraft object if found, None otherwise
         """
         # Normalize callsign (OpenSky stores callsigns with padding)
-        normalized_callsign = callsign.upper().ljust(8)
+        normalized_callsign = normalize_callsign(callsign)
+        
+        # Look in the states of the latest radius query first, highlighted aircraft are usually nearby
+        if self._last_states is not None:
+            fetched_at, states, last_update = self._last_states
+            if time.monotonic() - fetched_at < self.states_ttl:
+                aircraft = self._find_callsign(states, normalized_callsign, last_update)
+                if aircraft is not None:
+                    return aircraft
         
         # Get all states (no filtering by callsign is available in the API)
         response = await self._make_request("states/all")
         
         if response and "states" in response and response["states"]:
-            time_position = response.get("time", 0)
+            last_update = datetime.fromtimestamp(response.get("time") or 0)
+            return self._find_callsign(response["states"], normalized_callsign, last_update)
+        
+        return None
+    
+    def _find_callsign(self, states: List[List], normalized_callsign: str, last_update: datetime) -> Optional[Aircraft]:
+        """
+        Find an aircraft by callsign in a list of state vectors.
+        
+        Args:
+            states: State vectors from the OpenSky API
+            normalized_callsign: Normalized callsign of the aircraft
+            last_update: Time of the response the state vectors belong to
             
-            for state in response["states"]:
-                if state[1] and state[1].strip() == callsign.strip():
-                    return self._parse_state_vector(state, time_position)
+        Returns:
+            Aircraft object if found, None otherwise
+        """
+        for state in states:
+            if state[1] and normalize_callsign(state[1]) == normalized_callsign:
+                return self._parse_state_vector(state, last_update)
         
         return None
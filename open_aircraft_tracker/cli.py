@@ -3,13 +3,13 @@
 Command-line entry point for the Open Aircraft Tracker application.
 """
 import asyncio
+import functools
+from enum import Enum
 from typing import List, Optional
 
 import typer
-from rich.console import Console
 
-from open_aircraft_tracker.main import AircraftTracker
-from open_aircraft_tracker.utils.logging import LogLevel, setup_logging
+from open_aircraft_tracker.utils.logging import LogLevel, setup_logging, stop_logging
 
 # Create a Typer app instance
 app = typer.Typer(
@@ -18,8 +18,39 @@ app = typer.Typer(
     add_completion=True,
 )
 
-# Create a rich console for better output formatting
-console = Console()
+
+@functools.lru_cache(maxsize=None)
+def _console():
+    """
+    Get a rich console for better output formatting, creating it on first use.
+    
+    Returns:
+        Rich Console instance
+    """
+    # Only the error paths print with rich, so it isn't imported at startup
+    from rich.console import Console
+    
+    return Console()
+
+
+class APIType(str, Enum):
+    """Supported API type enum."""
+    OPENSKY = "opensky"
+    AIRLABS = "airlabs"
+    AVIATIONSTACK = "aviationstack"
+    FLIGHTAWARE = "flightaware"
+    FLIGHTRADAR24 = "flightradar24"
+    ADSBEXCHANGE = "adsbexchange"
+    MOCK = "mock"
+
+
+# Display names of the APIs that need an API key passed with --username
+API_KEY_REQUIRED = {
+    APIType.AIRLABS: "AirLabs",
+    APIType.AVIATIONSTACK: "AviationStack",
+    APIType.FLIGHTRADAR24: "FlightRadar24",
+    APIType.ADSBEXCHANGE: "ADSBexchange",
+}
 
 
 @app.command()
@@ -36,8 +67,8 @@ def main(
     update_interval: float = typer.Option(
         5.0, "--update-interval", "-u", help="Update interval in seconds"
     ),
-    api: str = typer.Option(
-        "opensky", "--api", "-a", 
+    api: APIType = typer.Option(
+        APIType.OPENSKY, "--api", "-a", 
         help="API to use (opensky, airlabs, aviationstack, flightaware, flightradar24, adsbexchange, mock)", 
         show_choices=True, case_sensitive=False
     ),
@@ -72,35 +103,25 @@ def main(
     The application displays a radar-like view of nearby aircraft and can alert you
     when new aircraft enter your specified radius.
     """
-    # Validate API type
-    if api.lower() not in ["opensky", "airlabs", "aviationstack", "flightaware", "flightradar24", "adsbexchange", "mock"]:
-        console.print(f"[bold red]Error:[/] Unknown API type: {api}")
+    # Validate API-specific requirements (typer already rejects unknown API types)
+    if api in API_KEY_REQUIRED and not username:
+        _console().print(f"[bold red]Error:[/] {API_KEY_REQUIRED[api]} API requires an API key (use --username to provide it)")
         raise typer.Exit(code=1)
     
-    # Validate API-specific requirements
-    if api.lower() == "airlabs" and not username:
-        console.print("[bold red]Error:[/] AirLabs API requires an API key (use --username to provide it)")
+    if api is APIType.FLIGHTAWARE and (not username or not password):
+        _console().print("[bold red]Error:[/] FlightAware API requires both username and API key (use --username and --password)")
         raise typer.Exit(code=1)
     
-    if api.lower() == "aviationstack" and not username:
-        console.print("[bold red]Error:[/] AviationStack API requires an API key (use --username to provide it)")
-        raise typer.Exit(code=1)
-    
-    if api.lower() == "flightaware" and (not username or not password):
-        console.print("[bold red]Error:[/] FlightAware API requires both username and API key (use --username and --password)")
-        raise typer.Exit(code=1)
-    
-    if api.lower() == "flightradar24" and not username:
-        console.print("[bold red]Error:[/] FlightRadar24 API requires an API key (use --username to provide it)")
-        raise typer.Exit(code=1)
+    # Import the tracker (and with it aiohttp, NumPy and blessed) only once the arguments are valid
+    from open_aircraft_tracker.api.base import normalize_callsign
+    from open_aircraft_tracker.main import AircraftTracker
     
-    if api.lower() == "adsbexchange" and not username:
-        console.print("[bold red]Error:[/] ADSBexchange API requires an API key (use --username to provide it)")
-        raise typer.Exit(code=1)
+    # Normalize the highlighted callsigns once, matching how API clients store callsigns
+    highlight = frozenset(normalize_callsign(c) for c in callsign) if callsign else frozenset()
     
     # Set up logging
     logger = setup_logging(log_level=log_level, log_file=log_file)
-    logger.info(f"Starting Open Aircraft Tracker with API: {api}")
+    logger.info(f"Starting Open Aircraft Tracker with API: {api.value}")
     logger.debug(f"Parameters: latitude={latitude}, longitude={longitude}, radius={radius}, update_interval={update_interval}")
     
     # Create aircraft tracker
@@ -109,24 +130,34 @@ def main(
         longitude=longitude,
         radius_km=radius,
         update_interval=update_interval,
-        api_type=api,
+        api_type=api.value,
         api_username=username,
         api_password=password,
-        callsigns=callsign,
+        callsigns=highlight,
         sound_file=sound_file,
         mock_aircraft_count=mock_aircraft_count,
         interactive=not non_interactive
     )
     
+    # Use the faster uvloop event loop when it is installed
+    try:
+        import uvloop
+        run = uvloop.run
+    except ImportError:
+        run = asyncio.run
+    
     try:
         # Run tracker
-        asyncio.run(tracker.run())
+        run(tracker.run())
     except KeyboardInterrupt:
-        console.print("\n[bold yellow]Interrupted by user. Exiting...[/]")
+        _console().print("\n[bold yellow]Interrupted by user. Exiting...[/]")
         raise typer.Exit()
     except Exception as e:
-        console.print(f"[bold red]Error:[/] {str(e)}")
+        _console().print(f"[bold red]Error:[/] {str(e)}")
         raise typer.Exit(code=1)
+    finally:
+        # Write out the log records still queued for the logging thread
+        stop_logging()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,153 @@
+"""
+In-memory model of the terminal screen.
+Frames are rendered into cell buffers, and only the cells that differ from what is
+already on the terminal are written out.
+"""
+import os
+import select
+import sys
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from blessed import Terminal
+
+# Cell buffer mapping screen positions to (character, color) pairs
+Cells = Dict[Tuple[int, int], Tuple[str, Optional[Callable]]]
+
+# Synchronized output markers, the terminal holds back painting until the end of the frame
+# (terminals without support for mode 2026 ignore them)
+BEGIN_SYNCHRONIZED_UPDATE = "\x1b[?2026h"
+END_SYNCHRONIZED_UPDATE = "\x1b[?2026l"
+
+
+class FrameBuffer:
+    """Double-buffered terminal screen that only writes the cells that changed."""
+
+    # Seconds between full repaints, which clean up anything else written to the terminal
+    FULL_REPAINT_INTERVAL = 60.0
+
+    def __init__(self, terminal: Terminal):
+        """
+        Initialize the frame buffer.
+
+        Args:
+            terminal: Blessed terminal instance
+        """
+        self.term = terminal
+
+        # Cells shown on the terminal after the last frame and the terminal size they were drawn for,
+        # None until the first frame (or after invalidate()) so that the screen is cleared once
+        self._front: Optional[Cells] = None
+        self._front_size: Optional[Tuple[int, int]] = None
+        self._last_full_repaint = 0.0
+
+        # Cursor movement escape sequences by screen position
+        self._moves: Dict[Tuple[int, int], str] = {}
+
+    def invalidate(self):
+        """Forget what is on the terminal, so the next frame clears the screen and repaints everything."""
+        self._front = None
+
+    def flush(self, cells: Cells, size: Tuple[int, int]):
+        """
+        Write a frame to the terminal, as a single synchronized update.
+
+        Args:
+            cells: Cells of the frame, the buffer must not be modified afterwards
+            size: Terminal size (width, height) the frame was rendered for
+        """
+        # Start from a cleared screen on the first frame, after a resize and every once in a while
+        buf: List[str] = [BEGIN_SYNCHRONIZED_UPDATE]
+        front = self._front
+        now = time.monotonic()
+        if front is None or size != self._front_size or now - self._last_full_repaint >= self.FULL_REPAINT_INTERVAL:
+            buf.append(self.term.clear())
+            front = {}
+            self._last_full_repaint = now
+
+        # Only write the cells that differ from the previous frame, and blank the ones that are gone
+        self._write_runs(buf, sorted((y, x) for (x, y), cell in cells.items() if front.get((x, y)) != cell), cells)
+        self._write_runs(buf, sorted((y, x) for (x, y) in front if (x, y) not in cells), {})
+        buf.append(self._move(0, 0))
+        buf.append(END_SYNCHRONIZED_UPDATE)
+
+        try:
+            self._write_frame("".join(buf))
+        except BaseException:
+            # Part of the frame may have reached the terminal, so repaint everything next time
+            self.invalidate()
+            raise
+
+        self._front = cells
+        self._front_size = size
+
+    def _move(self, x: int, y: int) -> str:
+        """
+        Get the escape sequence that moves the cursor to a screen position.
+
+        Args:
+            x: Screen column
+            y: Screen row
+
+        Returns:
+            Cursor movement escape sequence
+        """
+        move = self._moves.get((x, y))
+        if move is None:
+            move = self._moves[(x, y)] = self.term.move_xy(x, y)
+        return move
+
+    def _write_runs(self, buf: List[str], positions: List[Tuple[int, int]], cells: Cells):
+        """
+        Write cells to the output buffer, one cursor move per run of adjacent cells with the same color.
+
+        Args:
+            buf: Output buffer the escape sequences and text are appended to
+            positions: Sorted (y, x) positions of the cells to write
+            cells: Cell buffer to take the characters from, positions missing from it are blanked
+        """
+        run_x = run_y = 0
+        run_color = None
+        run_chars: List[str] = []
+
+        for y, x in positions:
+            char, color = cells.get((x, y), (" ", None))
+            if run_chars and (y != run_y or x != run_x + len(run_chars) or color is not run_color):
+                text = "".join(run_chars)
+                buf.append(self._move(run_x, run_y) + (run_color(text) if run_color else text))
+                run_chars = []
+
+            if not run_chars:
+                run_x, run_y, run_color = x, y, color
+            run_chars.append(char)
+
+        if run_chars:
+            text = "".join(run_chars)
+            buf.append(self._move(run_x, run_y) + (run_color(text) if run_color else text))
+
+    def _write_frame(self, frame: str):
+        """
+        Write a frame to the terminal.
+
+        Args:
+            frame: Escape sequences and text of the frame
+        """
+        try:
+            fd = sys.stdout.fileno()
+        except (AttributeError, OSError, ValueError):
+            # Streams without a file descriptor (e.g. captured output) get a plain write
+            sys.stdout.write(frame)
+            sys.stdout.flush()
+            return
+
+        # Write the encoded frame straight to the file descriptor, bypassing the text layer,
+        # after flushing anything still buffered so that output stays in order
+        sys.stdout.flush()
+        data = memoryview(frame.encode(sys.stdout.encoding or "utf-8", errors="replace"))
+        while data:
+            try:
+                data = data[os.write(fd, data):]
+            except BlockingIOError:
+                # Event loops such as uvloop can leave the terminal non-blocking while they watch
+                # stdin, so wait until it accepts more output when its buffer is full
+                select.select([], [fd], [])
@@ -3,14 +3,25 @@ Terminal-based radar display for aircraft tracking.
 Uses the blessed library to create an interactive radar-like display.
 """
 import asyncio
+import heapq
 import math
+import operator
+import time
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple, Set
+from typing import Callable, List, Optional, Tuple, Set
 
+import numpy as np
 from blessed import Terminal
-from geopy.distance import geodesic
 
-from open_aircraft_tracker.api.base import Aircraft
+from open_aircraft_tracker.api.base import Aircraft, intern_string, normalize_callsign
+from open_aircraft_tracker.display.framebuffer import Cells, FrameBuffer
+from open_aircraft_tracker.utils.geo import bounding_box_mask, haversine_km
+
+# Fields of an aircraft that show up on the radar or in the info panel
+_DISPLAYED_FIELDS = operator.attrgetter("callsign", "latitude", "longitude", "altitude", "velocity", "heading")
+
+# Unit circle points of the radar rings, one every 5 degrees
+_RING_POINTS = tuple((math.cos(math.radians(angle)), math.sin(math.radians(angle))) for angle in range(0, 360, 5))
 
 
 class RadarDisplay:
@@ -28,6 +39,13 @@ class RadarDisplay:
     WARNING_COLOR = "bright_red"
     INFO_COLOR = "bright_cyan"
     
+    # Info panel layout
+    PANEL_WIDTH = 40
+    PANEL_TITLE = " Aircraft Information "
+    PANEL_HEADER = " ".join(f"{h:<10}" for h in ("Callsign", "Alt(m)", "Hdg", "Spd(km/h)"))
+    PANEL_SEPARATOR = "-" * (PANEL_WIDTH - 2)
+    PANEL_ROW_FORMAT = "{:<10} {:<10} {:<10} {:<10}"
+    
     def __init__(self, terminal: Terminal, radius_km: float = 5.0):
         """
         Initialize the radar display.
@@ -42,13 +60,55 @@ class RadarDisplay:
         self.center_lon: Optional[float] = None
         self.aircraft_list: List[Aircraft] = []
         self.highlighted_callsigns: Set[str] = set()
+        
+        # Highlight status and displayed fields of each aircraft in the aircraft list
+        self._highlighted: List[bool] = []
+        self._displayed: List[Tuple] = []
         self.last_update = datetime.now()
         self.show_info = True
         
+        # Status bar times, formatted at most once per second and once per update respectively
+        self._clock: Tuple[int, str] = (-1, "")
+        self._last_update_str = self.last_update.strftime("%H:%M:%S")
+        
+        # Terminal size, read once per frame since every read is an ioctl
+        self._width = self.term.width
+        self._height = self.term.height
+        
         # Calculate radar dimensions
-        self.center_x = self.term.width // 2
-        self.center_y = self.term.height // 2
+        self._layout()
+        
+        # Build the color formatters once instead of for every drawn cell
+        try:
+            self._cyan = self.term.color_rgb(0, 255, 255)
+            self._gray = self.term.color_rgb(200, 200, 200)
+            self._yellow = self.term.color_rgb(255, 255, 0)
+            self._white = self.term.color_rgb(255, 255, 255)
+        except Exception:
+            # Fallback to plain text if color_rgb is not supported
+            self._cyan = self._gray = self._yellow = self._white = lambda text: text
+        
+        # Rendered radar background, keyed by the terminal size and radius it was rendered for
+        self._background_cache: Optional[Tuple[Tuple[int, int, float], Cells]] = None
+        
+        # Model of the terminal screen, which only writes the cells that changed between frames
+        self.framebuffer = FrameBuffer(terminal)
+        
+        # Cells of the radar, aircraft and info panel, re-rendered only when the display is dirty
+        self._base_cells: Cells = {}
+        self._dirty = True
+        
+        # Distances and screen positions of the aircraft in the current frame
+        self._distances = np.empty(0)
+        self._screen_x = np.empty(0, dtype=np.int64)
+        self._screen_y = np.empty(0, dtype=np.int64)
+    
+    def _layout(self):
+        """Calculate the radar dimensions for the current terminal size."""
+        self.center_x = self._width // 2
+        self.center_y = self._height // 2
         self.radar_radius = min(self.center_x, self.center_y) - 5
+        self._layout_size = (self._width, self._height)
     
     def set_center(self, latitude: float, longitude: float):
         """
@@ -60,6 +120,7 @@ class RadarDisplay:
         """
         self.center_lat = latitude
         self.center_lon = longitude
+        self._dirty = True
     
     def set_aircraft_list(self, aircraft_list: List[Aircraft]):
         """
@@ -68,8 +129,17 @@ class RadarDisplay:
         Args:
             aircraft_list: List of Aircraft objects
         """
+        # Polls often return the same aircraft with only a newer timestamp, which don't need
+        # to be drawn again
+        displayed = list(map(_DISPLAYED_FIELDS, aircraft_list))
+        if displayed != self._displayed:
+            self._highlighted = [self._is_highlighted(aircraft) for aircraft in aircraft_list]
+            self._displayed = displayed
+            self._dirty = True
+        
         self.aircraft_list = aircraft_list
         self.last_update = datetime.now()
+        self._last_update_str = self.last_update.strftime("%H:%M:%S")
     
     def highlight_callsign(self, callsign: str, highlight: bool = True):
         """
@@ -79,60 +149,58 @@ class RadarDisplay:
             callsign: Aircraft callsign
             highlight: Whether to highlight (True) or unhighlight (False)
         """
+        # Interned like the callsigns of parsed aircraft, so lookups can match by identity
         if highlight:
-            self.highlighted_callsigns.add(callsign.strip().upper())
+            self.highlighted_callsigns.add(intern_string(normalize_callsign(callsign)))
         else:
-            self.highlighted_callsigns.discard(callsign.strip().upper())
+            self.highlighted_callsigns.discard(normalize_callsign(callsign))
+        
+        self._highlighted = [self._is_highlighted(aircraft) for aircraft in self.aircraft_list]
+        self._dirty = True
     
-    def _calculate_screen_position(self, aircraft: Aircraft) -> Tuple[int, int]:
+    def _compute_positions_batch(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
         """
-        Calculate the screen position of an aircraft based on its coordinates.
+        Calculate the distances and screen positions of all aircraft in one vectorized pass.
         
-        Args:
-            aircraft: Aircraft object
-            
         Returns:
-            Tuple of (x, y) screen coordinates
+            Tuple of (distances in kilometers, screen x coordinates, screen y coordinates), in the
+            order of the aircraft list (distances are NaN for missing positions, and coordinates
+            are -1 for aircraft that can't be on the screen)
         """
-        if (self.center_lat is None or self.center_lon is None or
-            aircraft.latitude is None or aircraft.longitude is None):
-            return (0, 0)
+        count = len(self.aircraft_list)
+        if self.center_lat is None or self.center_lon is None:
+            return np.full(count, np.nan), np.zeros(count, dtype=np.int64), np.zeros(count, dtype=np.int64)
         
-        # Calculate distance and bearing from center
-        center = (self.center_lat, self.center_lon)
-        aircraft_pos = (aircraft.latitude, aircraft.longitude)
+        # Single precision is still far finer than a terminal cell and halves the memory traffic
+        lats = np.fromiter((np.nan if a.latitude is None else a.latitude for a in self.aircraft_list), dtype=np.float32, count=count)
+        lons = np.fromiter((np.nan if a.longitude is None else a.longitude for a in self.aircraft_list), dtype=np.float32, count=count)
         
-        # Calculate distance in kilometers
-        distance_km = geodesic(center, aircraft_pos).kilometers
+        # Calculate distance in kilometers (the info panel sorts all aircraft by it)
+        distances = haversine_km(self.center_lat, self.center_lon, lats, lons)
+        screen_x = np.full(count, -1, dtype=np.int64)
+        screen_y = np.full(count, -1, dtype=np.int64)
+        
+        # Skip the bearing trig for aircraft outside a box around the farthest point on the screen
+        visible_km = self.radius_km * math.hypot(self.center_x + 1, self.center_y + 1) / max(self.radar_radius, 1)
+        visible = np.flatnonzero(bounding_box_mask(self.center_lat, self.center_lon, lats, lons, visible_km))
         
         # Calculate bearing
         # Formula: θ = atan2(sin(Δlong).cos(lat2), cos(lat1).sin(lat2) − sin(lat1).cos(lat2).cos(Δlong))
         lat1 = math.radians(self.center_lat)
-        lat2 = math.radians(aircraft.latitude)
-        lon1 = math.radians(self.center_lon)
-        lon2 = math.radians(aircraft.longitude)
-        
-        dlon = lon2 - lon1
-        y = math.sin(dlon) * math.cos(lat2)
-        x = math.cos(lat1) * math.sin(lat2) - math.sin(lat1) * math.cos(lat2) * math.cos(dlon)
-        bearing = math.degrees(math.atan2(y, x))
-        
-        # Convert to 0-360 range
-        bearing = (bearing + 360) % 360
+        lat2 = np.radians(lats[visible])
+        dlon = np.radians(lons[visible]) - math.radians(self.center_lon)
+        y = np.sin(dlon) * np.cos(lat2)
+        x = math.cos(lat1) * np.sin(lat2) - math.sin(lat1) * np.cos(lat2) * np.cos(dlon)
+        bearing = (np.degrees(np.arctan2(y, x)) + 360) % 360
         
         # Convert polar coordinates (distance, bearing) to screen coordinates
-        # Note: In screen coordinates, y increases downward, so we negate the y component
-        distance_ratio = distance_km / self.radius_km
-        screen_radius = self.radar_radius * distance_ratio
-        
-        # Convert bearing to radians and adjust for screen coordinates
-        # In screen coordinates, 0 degrees is up, 90 degrees is right
-        bearing_rad = math.radians(90 - bearing)
-        
-        screen_x = self.center_x + int(screen_radius * math.cos(bearing_rad))
-        screen_y = self.center_y - int(screen_radius * math.sin(bearing_rad))
+        # In screen coordinates, 0 degrees is up, 90 degrees is right and y increases downward
+        screen_radius = self.radar_radius * distances[visible] / self.radius_km
+        bearing_rad = np.radians(90 - bearing)
+        screen_x[visible] = self.center_x + np.trunc(screen_radius * np.cos(bearing_rad)).astype(np.int64)
+        screen_y[visible] = self.center_y - np.trunc(screen_radius * np.sin(bearing_rad)).astype(np.int64)
         
-        return (screen_x, screen_y)
+        return distances, screen_x, screen_y
     
     def _is_highlighted(self, aircraft: Aircraft) -> bool:
         """
@@ -147,35 +215,46 @@ class RadarDisplay:
         if not aircraft.callsign:
             return False
         
-        return aircraft.callsign.strip().upper() in self.highlighted_callsigns
+        # API clients normalize callsigns when parsing, so no per-frame normalization is needed
+        return aircraft.callsign in self.highlighted_callsigns
+    
+    def _draw_radar_background(self, cells: Cells):
+        """
+        Draw the radar background with concentric rings.
+        
+        Args:
+            cells: Cell buffer mapping screen positions to (character, color) pairs
+        """
+        # The background only changes with the terminal size or the radius, so render it once
+        key = (self._width, self._height, self.radius_km)
+        if self._background_cache is None or self._background_cache[0] != key:
+            background: Cells = {}
+            self._render_radar_background(background)
+            self._background_cache = (key, background)
+        
+        cells.update(self._background_cache[1])
     
-    def _draw_radar_background(self):
-        """Draw the radar background with concentric rings."""
-        # Clear the screen
-        print(self.term.clear())
+    def _render_radar_background(self, cells: Cells):
+        """
+        Render the rings, center point, cardinal directions and range labels of the radar.
         
+        Args:
+            cells: Cell buffer mapping screen positions to (character, color) pairs
+        """
         # Draw concentric rings
+        width, height = self._width, self._height
+        ring = (self.RING_CHAR, self._gray)
         for i in range(1, 4):
             radius = self.radar_radius * i / 3
-            for angle in range(0, 360, 5):
-                angle_rad = math.radians(angle)
-                x = self.center_x + int(radius * math.cos(angle_rad))
-                y = self.center_y + int(radius * math.sin(angle_rad))
+            for cos_angle, sin_angle in _RING_POINTS:
+                x = self.center_x + int(radius * cos_angle)
+                y = self.center_y + int(radius * sin_angle)
                 
-                if 0 <= x < self.term.width and 0 <= y < self.term.height:
-                    try:
-                        print(self.term.move_xy(x, y) + self.term.color_rgb(200, 200, 200)(self.RING_CHAR))
-                    except Exception:
-                        # Fallback if color_rgb is not supported
-                        print(self.term.move_xy(x, y) + self.RING_CHAR)
+                if 0 <= x < width and 0 <= y < height:
+                    cells[(x, y)] = ring
         
         # Draw center point
-        try:
-            print(self.term.move_xy(self.center_x, self.center_y) + 
-                  self.term.color_rgb(0, 255, 255)(self.CENTER_CHAR))
-        except Exception:
-            # Fallback if color_rgb is not supported
-            print(self.term.move_xy(self.center_x, self.center_y) + self.CENTER_CHAR)
+        self._put(cells, self.center_x, self.center_y, self.CENTER_CHAR, self._cyan)
         
         # Draw cardinal directions
         directions = [
@@ -189,13 +268,8 @@ class RadarDisplay:
             x = self.center_x + int(self.radar_radius * dx * 1.1)
             y = self.center_y + int(self.radar_radius * dy * 1.1)
             
-            if 0 <= x < self.term.width and 0 <= y < self.term.height:
-                try:
-                    print(self.term.move_xy(x, y) + 
-                          self.term.color_rgb(0, 255, 255)(direction))
-                except Exception:
-                    # Fallback if color_rgb is not supported
-                    print(self.term.move_xy(x, y) + direction)
+            if 0 <= x < self._width and 0 <= y < self._height:
+                self._put(cells, x, y, direction, self._cyan)
         
         # Draw range rings labels
         for i in range(1, 4):
@@ -208,120 +282,75 @@ class RadarDisplay:
             x = self.center_x + int(radius * math.cos(angle_rad))
             y = self.center_y + int(radius * math.sin(angle_rad))
             
-            if 0 <= x < self.term.width and 0 <= y < self.term.height:
-                try:
-                    print(self.term.move_xy(x, y) + 
-                          self.term.color_rgb(0, 255, 255)(label))
-                except Exception:
-                    # Fallback if color_rgb is not supported
-                    print(self.term.move_xy(x, y) + label)
+            if 0 <= x < self._width and 0 <= y < self._height:
+                self._put(cells, x, y, label, self._cyan)
     
-    def _draw_aircraft(self):
-        """Draw aircraft on the radar."""
-        for aircraft in self.aircraft_list:
+    def _draw_aircraft(self, cells: Cells):
+        """
+        Draw aircraft on the radar.
+        
+        Args:
+            cells: Cell buffer mapping screen positions to (character, color) pairs
+        """
+        for aircraft, highlighted, x, y in zip(self.aircraft_list, self._highlighted, self._screen_x.tolist(), self._screen_y.tolist()):
             # Skip aircraft without position data
             if aircraft.latitude is None or aircraft.longitude is None:
                 continue
             
-            # Calculate screen position
-            x, y = self._calculate_screen_position(aircraft)
-            
             # Skip if outside screen bounds
-            if not (0 <= x < self.term.width and 0 <= y < self.term.height):
+            if not (0 <= x < self._width and 0 <= y < self._height):
                 continue
             
-            # Determine color based on highlight status
-            color = self.HIGHLIGHT_COLOR if self._is_highlighted(aircraft) else self.NORMAL_COLOR
-            
-            # Draw aircraft symbol
-            try:
-                # Use different colors for highlighted and normal aircraft
-                if self._is_highlighted(aircraft):
-                    print(self.term.move_xy(x, y) + 
-                          self.term.color_rgb(255, 255, 0)(self.AIRCRAFT_CHAR))  # Yellow for highlighted
-                else:
-                    print(self.term.move_xy(x, y) + 
-                          self.term.color_rgb(255, 255, 255)(self.AIRCRAFT_CHAR))  # White for normal
-            except Exception:
-                # Fallback if color_rgb is not supported
-                print(self.term.move_xy(x, y) + self.AIRCRAFT_CHAR)
+            # Draw the symbol and the callsign right after it as a single run, the callsign only
+            # if available, info display is enabled and it fits on screen
+            label = self.AIRCRAFT_CHAR
+            if self.show_info and aircraft.callsign and x + 1 < self._width - len(aircraft.callsign):
+                label += aircraft.callsign.strip()
             
-            # Draw callsign if available and info display is enabled
-            if self.show_info and aircraft.callsign:
-                callsign_x = x + 1
-                callsign_y = y
-                
-                # Ensure callsign is within screen bounds
-                if 0 <= callsign_x < self.term.width - len(aircraft.callsign) and 0 <= callsign_y < self.term.height:
-                    try:
-                        # Use different colors for highlighted and normal aircraft
-                        if self._is_highlighted(aircraft):
-                            print(self.term.move_xy(callsign_x, callsign_y) + 
-                                  self.term.color_rgb(255, 255, 0)(aircraft.callsign.strip()))  # Yellow for highlighted
-                        else:
-                            print(self.term.move_xy(callsign_x, callsign_y) + 
-                                  self.term.color_rgb(255, 255, 255)(aircraft.callsign.strip()))  # White for normal
-                    except Exception:
-                        # Fallback if color_rgb is not supported
-                        print(self.term.move_xy(callsign_x, callsign_y) + aircraft.callsign.strip())
+            # Use yellow for highlighted and white for normal aircraft
+            self._put(cells, x, y, label, self._yellow if highlighted else self._white)
     
-    def _draw_info_panel(self):
-        """Draw information panel with aircraft details."""
+    def _draw_info_panel(self, cells: Cells):
+        """
+        Draw information panel with aircraft details.
+        
+        Args:
+            cells: Cell buffer mapping screen positions to (character, color) pairs
+        """
         if not self.show_info:
             return
         
         # Draw panel border
-        panel_width = 40
-        panel_height = min(len(self.aircraft_list) + 4, self.term.height - 2)
-        panel_x = self.term.width - panel_width - 1
+        panel_width = self.PANEL_WIDTH
+        panel_height = min(len(self.aircraft_list) + 4, self._height - 2)
+        panel_x = self._width - panel_width - 1
         panel_y = 1
         
         # Draw panel title
-        title = " Aircraft Information "
-        try:
-            print(self.term.move_xy(panel_x + (panel_width - len(title)) // 2, panel_y) + 
-                  self.term.color_rgb(0, 255, 255)(title))
-        except Exception:
-            # Fallback if color_rgb is not supported
-            print(self.term.move_xy(panel_x + (panel_width - len(title)) // 2, panel_y) + title)
+        title = self.PANEL_TITLE
+        self._put(cells, panel_x + (panel_width - len(title)) // 2, panel_y, title, self._cyan)
         
         # Draw column headers
-        headers = ["Callsign", "Alt(m)", "Hdg", "Spd(km/h)"]
-        header_line = " ".join(f"{h:<10}" for h in headers)
-        try:
-            print(self.term.move_xy(panel_x + 1, panel_y + 2) + 
-                  self.term.color_rgb(0, 255, 255)(header_line))
-        except Exception:
-            # Fallback if color_rgb is not supported
-            print(self.term.move_xy(panel_x + 1, panel_y + 2) + header_line)
+        self._put(cells, panel_x + 1, panel_y + 2, self.PANEL_HEADER, self._cyan)
         
         # Draw separator
-        separator = "-" * (panel_width - 2)
-        try:
-            print(self.term.move_xy(panel_x + 1, panel_y + 3) + 
-                  self.term.color_rgb(0, 255, 255)(separator))
-        except Exception:
-            # Fallback if color_rgb is not supported
-            print(self.term.move_xy(panel_x + 1, panel_y + 3) + separator)
-        
-        # Sort aircraft by distance from center
-        sorted_aircraft = sorted(
-            [a for a in self.aircraft_list if a.latitude is not None and a.longitude is not None],
-            key=lambda a: geodesic(
-                (self.center_lat, self.center_lon), 
-                (a.latitude, a.longitude)
-            ).kilometers
+        self._put(cells, panel_x + 1, panel_y + 3, self.PANEL_SEPARATOR, self._cyan)
+        
+        # Pick the nearest aircraft that fit in the panel, using the distances already computed for this frame
+        distances = self._distances.tolist()
+        order = heapq.nsmallest(
+            max(panel_height - 5, 0),
+            (i for i, a in enumerate(self.aircraft_list) if a.latitude is not None and a.longitude is not None),
+            key=distances.__getitem__
         )
         
         # Draw aircraft information
-        for i, aircraft in enumerate(sorted_aircraft):
-            if i >= panel_height - 5:
-                break
-            
+        for i, index in enumerate(order):
             row_y = panel_y + 4 + i
+            aircraft = self.aircraft_list[index]
             
-            # Determine color based on highlight status
-            color = self.HIGHLIGHT_COLOR if self._is_highlighted(aircraft) else self.NORMAL_COLOR
+            # Use yellow for highlighted and white for normal aircraft
+            color = self._yellow if self._highlighted[index] else self._white
             
             # Format aircraft information
             callsign = aircraft.callsign.strip() if aircraft.callsign else "Unknown"
@@ -329,27 +358,23 @@ class RadarDisplay:
             heading = f"{int(aircraft.heading)}°" if aircraft.heading is not None else "N/A"
             speed = f"{int(aircraft.velocity * 3.6)}" if aircraft.velocity is not None else "N/A"
             
-            row_data = [callsign, altitude, heading, speed]
-            row_text = " ".join(f"{d:<10}" for d in row_data)
-            
-            try:
-                # Use different colors for highlighted and normal aircraft
-                if self._is_highlighted(aircraft):
-                    print(self.term.move_xy(panel_x + 1, row_y) + 
-                          self.term.color_rgb(255, 255, 0)(row_text))  # Yellow for highlighted
-                else:
-                    print(self.term.move_xy(panel_x + 1, row_y) + 
-                          self.term.color_rgb(255, 255, 255)(row_text))  # White for normal
-            except Exception:
-                # Fallback if color_rgb is not supported
-                print(self.term.move_xy(panel_x + 1, row_y) + row_text)
+            row_text = self.PANEL_ROW_FORMAT.format(callsign, altitude, heading, speed)
+            self._put(cells, panel_x + 1, row_y, row_text, color)
     
-    def _draw_status_bar(self):
-        """Draw status bar with general information."""
-        status_y = self.term.height - 1
+    def _draw_status_bar(self, cells: Cells):
+        """
+        Draw status bar with general information.
         
-        # Format current time
-        time_str = datetime.now().strftime("%H:%M:%S")
+        Args:
+            cells: Cell buffer mapping screen positions to (character, color) pairs
+        """
+        status_y = self._height - 1
+        
+        # Format current time, the string only changes once per second
+        now = int(time.time())
+        if now != self._clock[0]:
+            self._clock = (now, time.strftime("%H:%M:%S", time.localtime(now)))
+        time_str = self._clock[1]
         
         # Format center coordinates
         if self.center_lat is not None and self.center_lon is not None:
@@ -361,43 +386,77 @@ class RadarDisplay:
         count_str = f"Aircraft: {len(self.aircraft_list)}"
         
         # Format last update time
-        update_str = f"Updated: {self.last_update.strftime('%H:%M:%S')}"
+        update_str = f"Updated: {self._last_update_str}"
         
         # Combine status elements
         status_elements = [time_str, coords_str, count_str, update_str]
         status_text = " | ".join(status_elements)
         
         # Draw status bar
-        try:
-            print(self.term.move_xy(0, status_y) + 
-                  self.term.color_rgb(0, 255, 255)(status_text))
-        except Exception:
-            # Fallback if color_rgb is not supported
-            print(self.term.move_xy(0, status_y) + status_text)
+        self._put(cells, 0, status_y, status_text, self._cyan)
     
-    def _draw_help_text(self):
-        """Draw help text at the bottom of the screen."""
-        help_y = self.term.height - 2
+    def _draw_help_text(self, cells: Cells):
+        """
+        Draw help text at the bottom of the screen.
+        
+        Args:
+            cells: Cell buffer mapping screen positions to (character, color) pairs
+        """
+        help_y = self._height - 2
         help_text = "Press 'q' to quit, 'i' to toggle info panel, 'h' to toggle help"
         
-        try:
-            print(self.term.move_xy(0, help_y) + 
-                  self.term.color_rgb(0, 255, 255)(help_text))
-        except Exception:
-            # Fallback if color_rgb is not supported
-            print(self.term.move_xy(0, help_y) + help_text)
+        self._put(cells, 0, help_y, help_text, self._cyan)
+    
+    def _put(self, cells: Cells, x: int, y: int, text: str, color: Callable):
+        """
+        Write text into a cell buffer, clipped at the right edge of the terminal.
+        
+        Args:
+            cells: Cell buffer mapping screen positions to (character, color) pairs
+            x: Screen column of the first character
+            y: Screen row
+            text: Text to write
+            color: Color formatter for the text
+        """
+        width = self._width
+        for offset, char in enumerate(text):
+            if x + offset >= width:
+                break
+            cells[(x + offset, y)] = (char, color)
+    
+    def invalidate(self):
+        """Forget what is on the terminal, so the next frame clears the screen and repaints everything."""
+        self.framebuffer.invalidate()
     
     def draw(self):
         """Draw the complete radar display."""
-        self._draw_radar_background()
-        self._draw_aircraft()
-        self._draw_info_panel()
-        self._draw_status_bar()
-        self._draw_help_text()
-        
-        # Flush output
-        print(self.term.move_xy(0, 0), end="", flush=True)
+        # Read the terminal size once for the whole frame
+        self._width, self._height = self.term.width, self.term.height
+        size = (self._width, self._height)
+        
+        # Lay the radar out again when the terminal was resized
+        if size != self._layout_size:
+            self._layout()
+            self._dirty = True
+        
+        # Only render the radar again if something changed, otherwise just refresh the status bar
+        if self._dirty:
+            self._distances, self._screen_x, self._screen_y = self._compute_positions_batch()
+            self._base_cells = {}
+            self._draw_radar_background(self._base_cells)
+            self._draw_aircraft(self._base_cells)
+            self._draw_info_panel(self._base_cells)
+            self._dirty = False
+        
+        # Render the frame into a back buffer of cells
+        cells = dict(self._base_cells)
+        self._draw_status_bar(cells)
+        self._draw_help_text(cells)
+        
+        # Write only what changed to the terminal
+        self.framebuffer.flush(cells, size)
     
     def toggle_info_panel(self):
         """Toggle the information panel visibility."""
         self.show_info = not self.show_info
+        self._dirty = True
@@ -2,15 +2,20 @@
 Main module for the Open Aircraft Tracker application.
 """
 import asyncio
+import contextlib
+import gc
+import logging
+import operator
 import os
 import signal
 import sys
-from datetime import datetime
-from typing import Dict, List, Optional, Set
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, FrozenSet, Iterable, Optional, Tuple
 
 from blessed import Terminal
 
-from open_aircraft_tracker.api.base import Aircraft, AircraftTrackerAPI
+from open_aircraft_tracker.api.base import Aircraft, AircraftTrackerAPI, normalize_callsign
 from open_aircraft_tracker.api.mock import MockAPI
 from open_aircraft_tracker.api.opensky import OpenSkyAPI
 from open_aircraft_tracker.api.airlabs import AirLabsAPI
@@ -22,10 +27,38 @@ from open_aircraft_tracker.display.radar import RadarDisplay
 from open_aircraft_tracker.utils.sound import SoundAlert
 from open_aircraft_tracker.utils.logging import logger
 
+# Fields of a new aircraft that are printed in non-interactive mode
+_REPORTED_FIELDS = operator.attrgetter("callsign", "icao24", "latitude", "longitude", "altitude", "heading", "velocity")
+
+
+@contextlib.contextmanager
+def _preserve_blocking(fd: int):
+    """
+    Restore the blocking mode of a file descriptor on exit.
+    
+    Event loops such as uvloop make the file descriptors they watch non-blocking, and on a
+    terminal stdin and stdout usually share that flag, so it has to be put back for writes
+    and for the shell after exit.
+    
+    Args:
+        fd: File descriptor
+    """
+    blocking = os.get_blocking(fd)
+    try:
+        yield
+    finally:
+        os.set_blocking(fd, blocking)
+
 
 class AircraftTracker:
     """Main application class for aircraft tracking."""
     
+    # Minimum time between radar draws in seconds, which caps the frame rate at 60 frames per second
+    MIN_DRAW_INTERVAL = 1 / 60
+    
+    # Number of main loop iterations between full garbage collections
+    GC_INTERVAL = 256
+    
     def __init__(
         self,
         latitude: float,
@@ -35,7 +68,7 @@ class AircraftTracker:
         api_type: str = "opensky",
         api_username: Optional[str] = None,
         api_password: Optional[str] = None,
-        callsigns: Optional[List[str]] = None,
+        callsigns: Optional[Iterable[str]] = None,
         sound_file: Optional[str] = None,
         mock_aircraft_count: int = 20,
         interactive: bool = True
@@ -51,7 +84,7 @@ class AircraftTracker:
             api_type: API type ("opensky" or "mock")
             api_username: API username (if required)
             api_password: API password (if required)
-            callsigns: List of callsigns to highlight
+            callsigns: Callsigns to highlight
             sound_file: Path to a WAV file to use for alerts
             mock_aircraft_count: Number of simulated aircraft for mock API
             interactive: Whether to run in interactive mode with radar display
@@ -60,7 +93,7 @@ class AircraftTracker:
         self.longitude = longitude
         self.radius_km = radius_km
         self.update_interval = update_interval
-        self.callsigns = callsigns or []
+        self.callsigns: FrozenSet[str] = frozenset(normalize_callsign(callsign) for callsign in callsigns or ())
         self.interactive = interactive
         
         # Initialize API client
@@ -96,13 +129,17 @@ class AircraftTracker:
         else:
             raise ValueError(f"Unknown API type: {api_type}")
         
-        # Initialize sound alert
+        # Initialize sound alert, played on its own thread since opening the audio device can block
         self.sound_alert = SoundAlert(sound_file)
+        self._sound_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sound-alert")
         
         # Initialize terminal and radar display if in interactive mode
         if interactive:
             self.term = Terminal()
             self.radar = RadarDisplay(self.term, radius_km=radius_km)
+            
+            # Look up the clear screen sequence once instead of through blessed on every use
+            self._clear = str(self.term.clear)
             self.radar.set_center(latitude, longitude)
             
             # Highlight specified callsigns
@@ -111,67 +148,145 @@ class AircraftTracker:
         else:
             self.term = None
             self.radar = None
+            self._clear = ""
         
         # Set up state variables
         self.running = False
-        self.last_aircraft_set: Set[str] = set()  # Set of aircraft ICAOs in the last update
-        self.known_aircraft: Dict[str, Aircraft] = {}  # Dict of known aircraft by ICAO
+        self._stop_requested = asyncio.Event()  # Set by SIGINT and SIGTERM to wake up the main loop
+        self._draw_pending = False  # Whether a radar draw is scheduled
+        self._last_draw = float("-inf")  # Event loop time of the last radar draw
+        self.last_aircraft_set: Optional[FrozenSet[str]] = None  # Set of aircraft ICAOs in the last update, None before the first
+        self.known_aircraft: Dict[str, Aircraft] = {}  # Dict of aircraft in the last update by ICAO
+        self._clock: Tuple[int, str] = (-1, "")  # Last formatted time as (epoch second, "HH:MM:SS")
+    
+    def _time_str(self) -> str:
+        """
+        Get the current time formatted as HH:MM:SS.
+        
+        The string only changes once per second, so it is formatted at most once per second.
+        
+        Returns:
+            Current local time string
+        """
+        now = int(time.time())
+        if now != self._clock[0]:
+            self._clock = (now, time.strftime("%H:%M:%S", time.localtime(now)))
+        return self._clock[1]
+    
+    def _write_terminal(self, text: str):
+        """
+        Write text to the terminal with a single write and flush.
+        
+        Escape sequences and the text that follows them are written together, so the
+        terminal never shows a cleared screen without its new contents.
+        
+        Args:
+            text: Text and escape sequences to write
+        """
+        sys.stdout.write(text)
+        sys.stdout.flush()
+    
+    def _request_draw(self):
+        """
+        Schedule a radar draw.
+        
+        Requests made in the same event loop iteration (e.g. a keypress and an update) are
+        coalesced into a single draw, and draws are at least MIN_DRAW_INTERVAL apart so that
+        held-down keys don't flood the terminal.
+        """
+        if not self._draw_pending:
+            self._draw_pending = True
+            loop = asyncio.get_running_loop()
+            loop.call_later(max(self._last_draw + self.MIN_DRAW_INTERVAL - loop.time(), 0), self._draw)
+    
+    def _draw(self):
+        """Draw the radar for all draw requests made since the last draw."""
+        self._draw_pending = False
+        self._last_draw = asyncio.get_running_loop().time()
+        if not self.radar:
+            return
+        
+        try:
+            self.radar.draw()
+        except Exception as e:
+            logger.error(f"Error drawing radar: {e}", exc_info=True)
+            
+            # The failed frame may have been partly written, so repaint everything next time
+            self.radar.invalidate()
+    
+    def _play_alert(self):
+        """Play the sound alert, called on the sound thread."""
+        try:
+            self.sound_alert.play()
+        except Exception as e:
+            logger.error(f"Error playing sound alert: {e}")
     
     async def update_aircraft(self):
         """Update aircraft positions from the API."""
         try:
             logger.debug(f"Fetching aircraft within {self.radius_km} km of {self.latitude}, {self.longitude}")
             
-            # Get aircraft within radius
+            # Get aircraft within radius, run() waits for each update to finish before starting
+            # the next one, so polls never overlap and slow responses can't make them pile up
             aircraft_list = await self.api.get_aircraft_in_radius(
                 self.latitude, self.longitude, self.radius_km
             )
             
             logger.info(f"Found {len(aircraft_list)} aircraft within {self.radius_km} km radius")
-            logger.debug(f"Aircraft list: {[a.callsign.strip() if a.callsign else a.icao24 for a in aircraft_list]}")
-            
-            # Update known aircraft
-            current_aircraft_set = set()
-            for aircraft in aircraft_list:
-                current_aircraft_set.add(aircraft.icao24)
-                self.known_aircraft[aircraft.icao24] = aircraft
-                logger.debug(f"Aircraft details - ICAO: {aircraft.icao24}, Callsign: {aircraft.callsign}, "
-                            f"Position: {aircraft.latitude}, {aircraft.longitude}, Altitude: {aircraft.altitude}")
-            
-            # Check for new aircraft
-            new_aircraft = current_aircraft_set - self.last_aircraft_set
+            
+            # Only format the per-aircraft debug messages when they are logged
+            debug = logger.isEnabledFor(logging.DEBUG)
+            if debug:
+                logger.debug(f"Aircraft list: {[a.callsign.strip() if a.callsign else a.icao24 for a in aircraft_list]}")
+            
+            # Update known aircraft, which only keeps the aircraft of this update so that aircraft
+            # that left don't pile up over a long session
+            self.known_aircraft = {aircraft.icao24: aircraft for aircraft in aircraft_list}
+            current_aircraft_set = frozenset(self.known_aircraft)
+            if debug:
+                for aircraft in aircraft_list:
+                    logger.debug(f"Aircraft details - ICAO: {aircraft.icao24}, Callsign: {aircraft.callsign}, "
+                                f"Position: {aircraft.latitude}, {aircraft.longitude}, Altitude: {aircraft.altitude}")
+            
+            # Check for new aircraft and aircraft that have left the radius, the aircraft that are
+            # already in range on the first update aren't announced as new
+            if self.last_aircraft_set is None:
+                logger.info(f"{len(current_aircraft_set)} aircraft in range at startup")
+                new_aircraft = left_aircraft = frozenset()
+            else:
+                new_aircraft = current_aircraft_set - self.last_aircraft_set
+                left_aircraft = self.last_aircraft_set - current_aircraft_set
+            
             if new_aircraft:
                 logger.info(f"Detected {len(new_aircraft)} new aircraft: {list(new_aircraft)}")
                 
-                # Play sound alert for new aircraft
-                self.sound_alert.play()
+                # Play sound alert for new aircraft, without waiting for it
+                asyncio.get_running_loop().run_in_executor(self._sound_executor, self._play_alert)
                 
-                # Print information about new aircraft
+                # Print information about new aircraft, with a single write for all of them
                 if not self.interactive:
-                    print(f"\n=== New aircraft detected at {datetime.now().strftime('%H:%M:%S')} ===")
+                    lines = [f"\n=== New aircraft detected at {self._time_str()} ==="]
                     for icao in new_aircraft:
-                        aircraft = self.known_aircraft[icao]
-                        callsign = aircraft.callsign.strip() if aircraft.callsign else "Unknown"
-                        print(f"Aircraft: {callsign} (ICAO: {aircraft.icao24})")
-                        if aircraft.latitude is not None and aircraft.longitude is not None:
-                            print(f"Position: {aircraft.latitude:.6f}, {aircraft.longitude:.6f}")
-                        if aircraft.altitude is not None:
-                            print(f"Altitude: {aircraft.altitude:.1f} meters")
-                        if aircraft.heading is not None:
-                            print(f"Heading: {aircraft.heading:.1f}°")
-                        if aircraft.velocity is not None:
-                            print(f"Speed: {aircraft.velocity * 3.6:.1f} km/h")
-                        print()
-            
-            # Check for aircraft that have left the radius
-            left_aircraft = self.last_aircraft_set - current_aircraft_set
+                        callsign, icao24, latitude, longitude, altitude, heading, velocity = _REPORTED_FIELDS(self.known_aircraft[icao])
+                        lines.append(f"Aircraft: {callsign.strip() if callsign else 'Unknown'} (ICAO: {icao24})")
+                        if latitude is not None and longitude is not None:
+                            lines.append(f"Position: {latitude:.6f}, {longitude:.6f}")
+                        if altitude is not None:
+                            lines.append(f"Altitude: {altitude:.1f} meters")
+                        if heading is not None:
+                            lines.append(f"Heading: {heading:.1f}°")
+                        if velocity is not None:
+                            lines.append(f"Speed: {velocity * 3.6:.1f} km/h")
+                        lines.append("")
+                    self._write_terminal("\n".join(lines) + "\n")
+            
             if left_aircraft:
                 logger.info(f"{len(left_aircraft)} aircraft left the radius: {list(left_aircraft)}")
             
             # Update radar display if in interactive mode
             if self.interactive and self.radar:
                 self.radar.set_aircraft_list(aircraft_list)
-                self.radar.draw()
+                self._request_draw()
             
             # Update last aircraft set
             self.last_aircraft_set = current_aircraft_set
@@ -180,11 +295,106 @@ class AircraftTracker:
             logger.error(f"Error updating aircraft: {e}", exc_info=True)
             if self.interactive:
                 # Clear screen and display error
-                print(self.term.clear())
-                print(f"Error updating aircraft: {e}")
+                self._write_terminal(f"{self._clear}\nError updating aircraft: {e}\n")
+                
+                # The radar has to repaint everything over the error message
+                if self.radar:
+                    self.radar.invalidate()
             else:
                 print(f"Error updating aircraft: {e}")
     
+    async def _read_key(self, timeout: float) -> Optional[str]:
+        """
+        Wait for a keypress without blocking the event loop.
+        
+        Args:
+            timeout: Maximum time to wait in seconds
+            
+        Returns:
+            The key that was pressed, or None if no key was pressed before the timeout
+        """
+        # Keys that arrived in the same read as an earlier key are already buffered by blessed,
+        # and stdin won't become readable again for them
+        key = self.term.inkey(timeout=0)
+        if key:
+            return key
+        
+        loop = asyncio.get_running_loop()
+        fd = sys.stdin.fileno()
+        blocking = os.get_blocking(fd)
+        readable = loop.create_future()
+        
+        try:
+            loop.add_reader(fd, lambda: readable.done() or readable.set_result(None))
+        except NotImplementedError:
+            # Event loops without reader callbacks (the Windows proactor) wait in a thread instead
+            key = await asyncio.to_thread(self.term.inkey, timeout=timeout)
+            return key or None
+        
+        # Also wake up when a signal asks the tracker to stop
+        stop = asyncio.ensure_future(self._stop_requested.wait())
+        try:
+            await asyncio.wait((readable, stop), timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            loop.remove_reader(fd)
+            stop.cancel()
+            
+            # Put stdin (and with it, usually stdout) back into the mode it was in before
+            # the reader was added
+            os.set_blocking(fd, blocking)
+        
+        if not readable.done():
+            return None
+        
+        # The input is ready, so this doesn't block (it is empty for an incomplete escape sequence)
+        return self.term.inkey(timeout=0) or None
+    
+    async def _handle_keys(self, duration: float):
+        """
+        Handle keypresses for a period of time.
+        
+        Args:
+            duration: Time to handle keypresses for in seconds
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + duration
+        
+        while self.running:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return
+            
+            key = await self._read_key(remaining)
+            if key is None:
+                continue
+            
+            # Quit on 'q'
+            if key.lower() == "q":
+                logger.info("User requested to quit (pressed 'q')")
+                self.running = False
+            
+            # Toggle info panel on 'i'
+            elif key.lower() == "i" and self.radar:
+                logger.debug("Toggling info panel (pressed 'i')")
+                self.radar.toggle_info_panel()
+                self._request_draw()
+    
+    async def _sleep(self, delay: float):
+        """
+        Sleep, unless a signal asks the tracker to stop in the meantime.
+        
+        Args:
+            delay: Time to sleep in seconds
+        """
+        with contextlib.suppress(asyncio.TimeoutError):
+            await asyncio.wait_for(self._stop_requested.wait(), delay)
+    
+    def _request_stop(self):
+        """Stop the main loop, called for SIGINT and SIGTERM."""
+        logger.info("Received signal to terminate")
+        self.running = False
+        self._stop_requested.set()
+    
     async def run(self):
         """Run the aircraft tracker."""
         self.running = True
@@ -194,54 +404,61 @@ class AircraftTracker:
         logger.info(f"Tracking aircraft within {self.radius_km} km of {self.latitude}, {self.longitude}")
         logger.info(f"Update interval: {self.update_interval} seconds")
         if self.callsigns:
-            logger.info(f"Highlighting callsigns: {', '.join(self.callsigns)}")
+            logger.info(f"Highlighting callsigns: {', '.join(sorted(self.callsigns))}")
         
-        # Set up signal handlers
-        def handle_signal(sig, frame):
-            logger.info("Received signal to terminate")
-            self.running = False
-            if self.interactive:
-                # Restore terminal
-                print(self.term.normal_cursor())
-                print(self.term.clear())
-            
-            print("Exiting...")
-            sys.exit(0)
-        
-        signal.signal(signal.SIGINT, handle_signal)
-        signal.signal(signal.SIGTERM, handle_signal)
-        
-        # Hide cursor in interactive mode
-        if self.interactive:
-            print(self.term.hide_cursor(), end="", flush=True)
+        # Set up signal handlers that stop the main loop, so it restores the terminal on the way out
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, self._request_stop)
+            except NotImplementedError:
+                # Event loops without signal handler support (Windows) get a plain handler instead
+                signal.signal(sig, lambda signum, frame: loop.call_soon_threadsafe(self._request_stop))
         
         try:
-            # Main loop
+            # Main loop, with keys read one at a time without echo and the cursor hidden for the
+            # whole session in interactive mode
             logger.info("Starting main loop")
-            while self.running:
-                # Update aircraft
-                await self.update_aircraft()
-                
-                # Handle user input in interactive mode
+            with contextlib.ExitStack() as terminal_modes:
                 if self.interactive:
-                    # Check for keypress
-                    if self.term.inkey(timeout=self.update_interval):
-                        key = self.term.inkey()
-                        
-                        # Quit on 'q'
-                        if key.lower() == "q":
-                            logger.info("User requested to quit (pressed 'q')")
-                            self.running = False
-                            break
+                    terminal_modes.enter_context(self.term.cbreak())
+                    terminal_modes.enter_context(self.term.hidden_cursor())
+                    
+                    # Leave the terminal in the blocking mode it was in, whatever the event loop did to it
+                    terminal_modes.enter_context(_preserve_blocking(sys.stdin.fileno()))
+                    terminal_modes.enter_context(_preserve_blocking(sys.stdout.fileno()))
+                
+                # Updates are scheduled at fixed deadlines on the monotonic loop clock, so the
+                # update rate doesn't drift by the time spent in each iteration
+                next_update = loop.time()
+                iterations = 0
+                while self.running:
+                    next_update += self.update_interval
+                    
+                    # Collect garbage now and then, so that it doesn't build up over long sessions
+                    # and slow down key reads
+                    iterations += 1
+                    if iterations % self.GC_INTERVAL == 0:
+                        gc.collect()
+                    
+                    if self.interactive:
+                        # Fetch in the background and handle user input until the next update is due
+                        update = asyncio.create_task(self.update_aircraft())
+                        await self._handle_keys(next_update - loop.time())
                         
-                        # Toggle info panel on 'i'
-                        elif key.lower() == "i" and self.radar:
-                            logger.debug("Toggling info panel (pressed 'i')")
-                            self.radar.toggle_info_panel()
-                            self.radar.draw()
-                else:
-                    # Wait for update interval in non-interactive mode
-                    await asyncio.sleep(self.update_interval)
+                        # Don't start the next update before this one has finished, and drop it on quit
+                        if not self.running:
+                            update.cancel()
+                        with contextlib.suppress(asyncio.CancelledError):
+                            await update
+                    else:
+                        # Wait for the next update while this one is in flight in non-interactive mode,
+                        # so that updates start every update_interval however long the API takes
+                        await asyncio.gather(self.update_aircraft(), self._sleep(next_update - loop.time()))
+                    
+                    # After a slow update, start the next one right away instead of catching up
+                    # on the missed ones with back-to-back requests
+                    next_update = max(next_update, loop.time())
         
         except Exception as e:
             logger.error(f"Unexpected error in main loop: {e}", exc_info=True)
@@ -249,7 +466,18 @@ class AircraftTracker:
         
         finally:
             logger.info("Shutting down aircraft tracker")
-            # Restore terminal
+            # Release pooled HTTP connections and the sound thread
+            await self.api.aclose()
+            self._sound_executor.shutdown(wait=False, cancel_futures=True)
+            
+            # Clear the radar, the cursor is already shown again
             if self.interactive:
-                print(self.term.normal_cursor())
-                print(self.term.clear())
+                self._write_terminal(f"\n{self._clear}\n")
+            
+            # Stop handling signals once the tracker has stopped
+            for sig in (signal.SIGINT, signal.SIGTERM):
+                with contextlib.suppress(NotImplementedError):
+                    loop.remove_signal_handler(sig)
+            
+            if self._stop_requested.is_set():
+                print("Exiting...")
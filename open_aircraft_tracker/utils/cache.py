@@ -0,0 +1,83 @@
+"""
+Small in-process caches used to avoid repeating identical work.
+"""
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+class TTLCache:
+    """Size-bounded cache whose entries expire after a time-to-live."""
+
+    def __init__(self, maxsize: int = 128, ttl: float = 2.0):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries, the least recently used entry is evicted first
+            ttl: Default time-to-live of an entry in seconds
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Get a value from the cache.
+
+        Args:
+            key: Cache key
+            default: Value to return if the key is missing or expired
+
+        Returns:
+            The cached value, or the default
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+
+        # Expired entries are kept until they are evicted, see get_stale()
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            return default
+
+        self._entries.move_to_end(key)
+        return value
+
+    def get_stale(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Get a value from the cache, even if it has expired.
+
+        This lets callers revalidate an expired value instead of computing it from scratch.
+
+        Args:
+            key: Cache key
+            default: Value to return if the key is missing
+
+        Returns:
+            The cached value, or the default
+        """
+        entry = self._entries.get(key)
+        return default if entry is None else entry[1]
+
+    def put(self, key: Hashable, value: Any, ttl: Optional[float] = None):
+        """
+        Store a value in the cache.
+
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl: Time-to-live in seconds (defaults to the cache's ttl)
+        """
+        self._entries[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        """Remove all entries from the cache."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
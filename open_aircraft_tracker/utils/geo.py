@@ -0,0 +1,176 @@
+"""
+Geographic helper functions for aircraft tracking.
+Provides vectorized distance calculations used to filter aircraft by radius.
+The radius filter is compiled with Numba when it is installed and falls back to NumPy otherwise.
+"""
+import functools
+import math
+from typing import Tuple
+
+import numpy as np
+
+try:
+    import numba
+except ImportError:  # pragma: no cover - depends on the environment
+    numba = None
+
+# Mean radius of the Earth in kilometers
+EARTH_RADIUS_KM = 6371.0
+
+
+@functools.lru_cache(maxsize=64)
+def _prep_center(center_lat: float, center_lon: float) -> Tuple[float, float, float]:
+    """
+    Precompute the per-query constants of a center point.
+
+    The tracker polls the same location over and over, so these are memoized.
+
+    Args:
+        center_lat: Center latitude in decimal degrees
+        center_lon: Center longitude in decimal degrees
+
+    Returns:
+        Tuple of (latitude in radians, longitude in radians, cosine of the latitude)
+    """
+    lat_rad = math.radians(center_lat)
+    return lat_rad, math.radians(center_lon), math.cos(lat_rad)
+
+
+@functools.lru_cache(maxsize=64)
+def _bounding_box_deltas(center_lat: float, radius_km: float) -> Tuple[float, float]:
+    """
+    Compute the half-sizes of a box that encloses a radius around a center latitude.
+
+    Args:
+        center_lat: Center latitude in decimal degrees
+        radius_km: Radius in kilometers
+
+    Returns:
+        Tuple of (latitude delta, longitude delta) in decimal degrees
+    """
+    # 1 degree of latitude is slightly more than 111 km
+    lat_delta = radius_km / 111.0
+
+    # Scale the longitude range by the narrowest latitude in the box
+    max_lat = min(90.0, abs(center_lat) + lat_delta)
+    lon_delta = radius_km / (111.0 * max(math.cos(math.radians(max_lat)), 1e-6))
+
+    return lat_delta, lon_delta
+
+
+def haversine_km(center_lat: float, center_lon: float, lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+    """
+    Calculate great-circle distances from a center point using the haversine formula.
+
+    Args:
+        center_lat: Center latitude in decimal degrees
+        center_lon: Center longitude in decimal degrees
+        lats: Array of latitudes in decimal degrees
+        lons: Array of longitudes in decimal degrees
+
+    Returns:
+        Array of distances in kilometers (NaN where a position is missing)
+    """
+    _, _, cos_center_lat = _prep_center(center_lat, center_lon)
+    dlat = np.radians(lats - center_lat)
+    dlon = np.radians(lons - center_lon)
+    a = np.sin(dlat / 2) ** 2 + cos_center_lat * np.cos(np.radians(lats)) * np.sin(dlon / 2) ** 2
+
+    # Clamp to guard against rounding errors pushing arcsin out of its domain
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+
+
+def bounding_box_mask(center_lat: float, center_lon: float, lats: np.ndarray, lons: np.ndarray, radius_km: float) -> np.ndarray:
+    """
+    Build a cheap mask of the positions inside a box that encloses the radius.
+
+    The box is slightly larger than the circle, so it only rejects positions that are
+    certainly outside the radius and never drops a candidate.
+
+    Args:
+        center_lat: Center latitude in decimal degrees
+        center_lon: Center longitude in decimal degrees
+        lats: Array of latitudes in decimal degrees (NaN for missing values)
+        lons: Array of longitudes in decimal degrees (NaN for missing values)
+        radius_km: Radius in kilometers
+
+    Returns:
+        Boolean array, True for positions inside the bounding box
+    """
+    lat_delta, lon_delta = _bounding_box_deltas(center_lat, radius_km)
+
+    # Wrap longitude differences into [-180, 180) so boxes across the antimeridian work
+    dlon = np.abs((lons - center_lon + 180.0) % 360.0 - 180.0)
+
+    return (np.abs(lats - center_lat) <= lat_delta) & (dlon <= lon_delta)
+
+
+if numba is not None:
+    # Fast-math flags without "nnan", since NaN marks aircraft without a position
+    @numba.njit(parallel=True, cache=True, fastmath={"contract", "afn", "reassoc"})
+    def _filter_within_radius_numba(
+        center_lat, center_lon, center_lat_rad, cos_center_lat, lat_delta, lats, lons, radius_km
+    ):
+        """Compiled radius filter used when Numba is available."""
+        mask = np.zeros(lats.shape[0], dtype=np.bool_)
+
+        for i in numba.prange(lats.shape[0]):
+            # Latitude alone rules out most distant aircraft without any trig
+            if not abs(lats[i] - center_lat) <= lat_delta:
+                continue
+
+            lat_rad = math.radians(lats[i])
+            sin_dlat = math.sin((lat_rad - center_lat_rad) / 2)
+            sin_dlon = math.sin(math.radians(lons[i] - center_lon) / 2)
+            a = sin_dlat * sin_dlat + cos_center_lat * math.cos(lat_rad) * sin_dlon * sin_dlon
+            mask[i] = 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(min(a, 1.0))) <= radius_km
+
+        return mask
+else:
+    _filter_within_radius_numba = None
+
+
+def filter_within_radius(center_lat: float, center_lon: float, lats: np.ndarray, lons: np.ndarray, radius_km: float) -> np.ndarray:
+    """
+    Build a mask of the positions that lie within a radius of a center point.
+
+    Args:
+        center_lat: Center latitude in decimal degrees
+        center_lon: Center longitude in decimal degrees
+        lats: Array of latitudes in decimal degrees (NaN for missing values)
+        lons: Array of longitudes in decimal degrees (NaN for missing values)
+        radius_km: Radius in kilometers
+
+    Returns:
+        Boolean array, True for positions within the radius
+    """
+    # NaN distances compare as False, so aircraft without a position are dropped
+    if _filter_within_radius_numba is not None:
+        center_lat_rad, _, cos_center_lat = _prep_center(center_lat, center_lon)
+        lat_delta, _ = _bounding_box_deltas(center_lat, radius_km)
+        return _filter_within_radius_numba(
+            float(center_lat),
+            float(center_lon),
+            center_lat_rad,
+            cos_center_lat,
+            lat_delta,
+            np.ascontiguousarray(lats, dtype=np.float64),
+            np.ascontiguousarray(lons, dtype=np.float64),
+            float(radius_km)
+        )
+
+    mask = bounding_box_mask(center_lat, center_lon, lats, lons, radius_km)
+    candidates = np.flatnonzero(mask)
+
+    # Drop the corners of the box with a squared flat-earth distance, using the narrowest
+    # longitude scale of the box and a 5% margin so that it never rejects a position in range
+    lat_delta, lon_delta = _bounding_box_deltas(center_lat, radius_km)
+    dy = (lats[candidates] - center_lat) * 111.0
+    dx = ((lons[candidates] - center_lon + 180.0) % 360.0 - 180.0) * (radius_km / lon_delta)
+    candidates = candidates[dy * dy + dx * dx <= (radius_km * 1.05) ** 2]
+
+    # Only run the haversine on the remaining candidates
+    mask[:] = False
+    mask[candidates] = haversine_km(center_lat, center_lon, lats[candidates], lons[candidates]) <= radius_km
+
+    return mask
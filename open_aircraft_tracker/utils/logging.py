@@ -2,10 +2,26 @@
 Logging module for the Open Aircraft Tracker application.
 """
 import logging
+import logging.handlers
 import os
+import queue
 import sys
 from enum import Enum
-from typing import Optional
+from typing import Optional, Tuple
+
+# Logging levels by log level name
+_LEVEL_MAP = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+}
+
+# Background listener that writes queued log records to the real handlers
+_listener: Optional[logging.handlers.QueueListener] = None
+
+# Level and log file of the running setup, None when logging isn't set up
+_configured: Optional[Tuple[int, Optional[str]]] = None
 
 
 class LogLevel(str, Enum):
@@ -20,6 +36,12 @@ def setup_logging(log_level: str = "INFO", log_file: Optional[str] = None) -> lo
     """
     Set up logging for the application.
     
+    Log calls only put the record on a queue, and a background thread writes it to the
+    console and log file, so that logging never blocks the event loop on a slow terminal
+    or disk. Call stop_logging() before exiting to write out the remaining records.
+    
+    Calling it again with the same settings keeps the running setup.
+    
     Args:
         log_level: Log level (DEBUG, INFO, WARNING, ERROR)
         log_file: Path to log file (if None, log to console only)
@@ -27,20 +49,19 @@ def setup_logging(log_level: str = "INFO", log_file: Optional[str] = None) -> lo
     Returns:
         Logger instance
     """
+    global _listener, _configured
+    
     # Convert string log level to logging level
-    level_map = {
-        "DEBUG": logging.DEBUG,
-        "INFO": logging.INFO,
-        "WARNING": logging.WARNING,
-        "ERROR": logging.ERROR,
-    }
-    level = level_map.get(log_level.upper(), logging.INFO)
+    level = _LEVEL_MAP.get(log_level.upper(), logging.INFO)
     
-    # Create logger
+    # Create logger, keeping its handlers if logging is already set up the same way
     logger = logging.getLogger("open_aircraft_tracker")
+    if _configured == (level, log_file):
+        return logger
     logger.setLevel(level)
     
-    # Remove existing handlers
+    # Remove existing handlers, and stop the listener of a previous setup
+    stop_logging()
     for handler in logger.handlers[:]:
         logger.removeHandler(handler)
     
@@ -54,7 +75,7 @@ def setup_logging(log_level: str = "INFO", log_file: Optional[str] = None) -> lo
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(level)
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+    handlers = [console_handler]
     
     # Create file handler if log file is specified
     if log_file:
@@ -67,10 +88,28 @@ def setup_logging(log_level: str = "INFO", log_file: Optional[str] = None) -> lo
         file_handler = logging.FileHandler(log_file)
         file_handler.setLevel(level)
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        handlers.append(file_handler)
+    
+    # Send records through a queue to a listener thread that owns the real handlers
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    
+    _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    _configured = (level, log_file)
     
     return logger
 
 
+def stop_logging():
+    """Stop the background logging thread, after it has written all queued records."""
+    global _listener, _configured
+    
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+    _configured = None
+
+
 # Global logger instance
 logger = logging.getLogger("open_aircraft_tracker")
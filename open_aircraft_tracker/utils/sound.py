@@ -2,17 +2,68 @@
 Sound alert functionality for aircraft tracking.
 Uses simpleaudio to play sound alerts when aircraft enter the specified radius.
 """
+import functools
 import os
 import threading
+import time
 from pathlib import Path
 from typing import Optional
 
+import numpy as np
 import simpleaudio as sa
 
 
+@functools.lru_cache(maxsize=1)
+def _default_beep_wav() -> bytes:
+    """
+    Generate the default beep sound, a 0.5 second 1 kHz sine wave.
+    
+    The sound never changes, so it is only generated once.
+    
+    Returns:
+        WAV file data (8-bit mono at 44.1 kHz)
+    """
+    sample_rate = 44100
+    duration = 0.5  # seconds
+    frequency = 1000  # Hz
+    
+    # Generate the sine wave in one vectorized pass
+    t = np.arange(int(duration * sample_rate))
+    audio_data = (127 + 127 * np.sin(2 * np.pi * frequency * t / sample_rate)).astype(np.uint8).tobytes()
+    
+    # Create WAV file with the header updated for the data size
+    header = bytearray(SoundAlert.DEFAULT_SOUND_DATA[:44])
+    header[4:8] = (36 + len(audio_data)).to_bytes(4, byteorder='little')  # Chunk size
+    header[40:44] = len(audio_data).to_bytes(4, byteorder='little')  # Data size
+    
+    return bytes(header) + audio_data
+
+
+@functools.lru_cache(maxsize=16)
+def _load_wav(path: str, mtime_ns: int, size: int) -> bytes:
+    """
+    Read a WAV file.
+    
+    The result is cached on the modification time and size as well as the path,
+    so a file that was replaced is read again.
+    
+    Args:
+        path: Absolute path of the file
+        mtime_ns: Modification time of the file in nanoseconds
+        size: Size of the file in bytes
+        
+    Returns:
+        WAV file data
+    """
+    return Path(path).read_bytes()
+
+
 class SoundAlert:
     """Sound alert functionality for aircraft tracking."""
     
+    # Minimum time between two alerts in seconds, so that alerts in quick succession don't stack
+    MIN_PLAY_INTERVAL = 0.25
+    
     # Default sound file (a simple beep)
     DEFAULT_SOUND_DATA = bytes([
         # WAV header (44 bytes)
@@ -45,62 +96,37 @@ class SoundAlert:
         self.play_obj = None
         self.lock = threading.Lock()
         
-        # Generate a simple beep sound if no sound file is provided
+        # Use a simple beep sound if no sound file is provided
         if not sound_file:
-            # Create a simple sine wave beep
-            sample_rate = 44100
-            duration = 0.5  # seconds
-            frequency = 1000  # Hz
-            
-            # Generate sine wave
-            import math
-            import array
-            
-            samples = []
-            for i in range(int(duration * sample_rate)):
-                sample = int(127 + 127 * math.sin(2 * math.pi * frequency * i / sample_rate))
-                samples.append(sample)
-            
-            # Convert to bytes
-            audio_data = array.array('B', samples).tobytes()
-            
-            # Update WAV header with correct data size
-            data_size = len(audio_data)
-            chunk_size = 36 + data_size
-            
-            # Create WAV file with correct header
-            header = bytearray(self.DEFAULT_SOUND_DATA[:44])
-            
-            # Update chunk size (bytes 4-7)
-            header[4:8] = chunk_size.to_bytes(4, byteorder='little')
-            
-            # Update data size (bytes 40-43)
-            header[40:44] = data_size.to_bytes(4, byteorder='little')
-            
-            # Combine header and audio data
-            self.sound_data = bytes(header) + audio_data
+            self.sound_data = _default_beep_wav()
         else:
             # Load sound file
-            if not os.path.exists(sound_file):
-                raise FileNotFoundError(f"Sound file not found: {sound_file}")
+            try:
+                stat = os.stat(sound_file)
+            except FileNotFoundError:
+                raise FileNotFoundError(f"Sound file not found: {sound_file}") from None
             
-            with open(sound_file, 'rb') as f:
-                self.sound_data = f.read()
+            self.sound_data = _load_wav(os.path.abspath(sound_file), stat.st_mtime_ns, stat.st_size)
+        
+        # Wrap the sound data once instead of passing the buffer on every play
+        self.wave = sa.WaveObject(self.sound_data, num_channels=1, bytes_per_sample=1, sample_rate=44100)
+        self._last_play = float("-inf")
     
     def play(self):
         """Play the sound alert."""
         with self.lock:
-            # Stop any currently playing sound
-            if self.play_obj and self.play_obj.is_playing():
+            # Ignore alerts right after the previous one
+            now = time.monotonic()
+            if now - self._last_play < self.MIN_PLAY_INTERVAL:
+                return
+            self._last_play = now
+            
+            # Stop any currently playing sound (stopping a finished sound does nothing)
+            if self.play_obj:
                 self.play_obj.stop()
             
             # Play the sound
-            self.play_obj = sa.play_buffer(
-                self.sound_data,
-                num_channels=1,
-                bytes_per_sample=1,
-                sample_rate=44100
-            )
+            self.play_obj = self.wave.play()
     
     def stop(self):
         """Stop the sound alert if it's playing."""
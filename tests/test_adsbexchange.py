@@ -0,0 +1,41 @@
+"""
+Tests for parsing ADSBexchange responses.
+"""
+from datetime import datetime, timedelta
+
+import pytest
+
+from open_aircraft_tracker.api.adsbexchange import ADSBexchangeAPI
+
+
+def test_parse_aircraft_subtracts_seen_from_poll_time():
+    """Test that 'seen' is interpreted as seconds before the poll time."""
+    api = ADSBexchangeAPI(api_key="test")
+    now = datetime(2024, 1, 1, 12, 0, 0)
+    flight = {
+        "hex": "ABC123",
+        "flight": "SWR1  ",
+        "lat": 47.38,
+        "lon": 8.54,
+        "alt_baro": 1000,
+        "gs": 100,
+        "seen": 5
+    }
+    
+    aircraft = api._parse_aircraft(flight, now=now)
+    
+    assert aircraft.icao24 == "abc123"
+    assert aircraft.callsign == "SWR1"
+    assert aircraft.altitude == pytest.approx(304.8)
+    assert aircraft.velocity == pytest.approx(51.4444)
+    assert aircraft.last_update == now - timedelta(seconds=5)
+
+
+def test_parse_aircraft_keeps_fractional_seen():
+    """Test that the timestamp keeps the sub-second part of 'seen'."""
+    api = ADSBexchangeAPI(api_key="test")
+    now = datetime(2024, 1, 1, 12, 0, 0)
+    
+    aircraft = api._parse_aircraft({"hex": "abc123", "lat": 47.38, "lon": 8.54, "seen": 0.25}, now=now)
+    
+    assert aircraft.last_update == now - timedelta(seconds=0.25)
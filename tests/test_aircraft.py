@@ -5,7 +5,7 @@ from datetime import datetime
 
 import pytest
 
-from open_aircraft_tracker.api.base import Aircraft
+from open_aircraft_tracker.api.base import Aircraft, normalize_callsign
 
 
 def test_aircraft_creation():
@@ -62,3 +62,9 @@ def test_aircraft_with_optional_fields():
     assert aircraft.heading is None
     assert aircraft.vertical_rate is None
     assert aircraft.last_update == now
+
+
+def test_normalize_callsign():
+    """Test normalizing callsigns for lookups."""
+    assert normalize_callsign("  swr123 ") == "SWR123"
+    assert normalize_callsign("Dlh4Ab") == "DLH4AB"
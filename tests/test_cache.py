@@ -0,0 +1,48 @@
+"""
+Tests for the in-process caches.
+"""
+import time
+
+from open_aircraft_tracker.utils.cache import TTLCache
+
+
+def test_ttl_cache_expires_entries():
+    """Test that entries are returned until their time-to-live has passed."""
+    cache = TTLCache(maxsize=4, ttl=0.05)
+    cache.put("radius", {"ac": []})
+    cache.put("callsign", {"ac": []}, ttl=10.0)
+
+    assert cache.get("radius") == {"ac": []}
+
+    time.sleep(0.06)
+
+    assert cache.get("radius") is None
+    assert cache.get("callsign") == {"ac": []}
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    """Test that the cache stays within its maximum size."""
+    cache = TTLCache(maxsize=2, ttl=10.0)
+    cache.put("a", 1)
+    cache.put("b", 2)
+
+    # Touch "a" so that "b" becomes the least recently used entry
+    cache.get("a")
+    cache.put("c", 3)
+
+    assert len(cache) == 2
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def test_ttl_cache_keeps_expired_entries_for_revalidation():
+    """Test that expired entries can still be read with get_stale."""
+    cache = TTLCache(maxsize=4, ttl=0.05)
+    cache.put("radius", {"ac": []})
+
+    time.sleep(0.06)
+
+    assert cache.get("radius") is None
+    assert cache.get_stale("radius") == {"ac": []}
+    assert cache.get_stale("callsign") is None
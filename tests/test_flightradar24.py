@@ -0,0 +1,25 @@
+"""
+Tests for parsing FlightRadar24 responses.
+"""
+from datetime import datetime
+
+import pytest
+
+from open_aircraft_tracker.api.flightradar24 import FlightRadar24API
+
+
+def test_parse_feed_entry():
+    """Test parsing an aircraft entry from the feed.js endpoint."""
+    api = FlightRadar24API(api_key="test")
+    entry = ["ABC123", 47.38, 8.55, 90, 1000, 200, "SWR1", "A320", "HB-JXA", 1700000000, "ZRH", "GVA", "LX1", 0, "1000"]
+    
+    aircraft = api._parse_aircraft(entry)
+    
+    assert aircraft.icao24 == "abc123"
+    assert aircraft.callsign == "SWR1"
+    assert aircraft.latitude == 47.38
+    assert aircraft.longitude == 8.55
+    assert aircraft.altitude == pytest.approx(304.8)
+    assert aircraft.velocity == pytest.approx(102.8888)
+    assert aircraft.vertical_rate == 0.0
+    assert aircraft.last_update == datetime.fromtimestamp(1700000000)
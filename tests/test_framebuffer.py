@@ -0,0 +1,105 @@
+"""
+Tests for the terminal frame buffer.
+"""
+import io
+import os
+import threading
+import time
+
+import pytest
+from blessed import Terminal
+
+from open_aircraft_tracker.display.framebuffer import (
+    BEGIN_SYNCHRONIZED_UPDATE,
+    END_SYNCHRONIZED_UPDATE,
+    FrameBuffer
+)
+
+
+@pytest.fixture
+def framebuffer():
+    """Create a frame buffer on a terminal that always writes escape sequences."""
+    return FrameBuffer(Terminal(kind="xterm-256color", force_styling=True))
+
+
+def _flush(framebuffer, cells, monkeypatch):
+    """Flush a frame and return what was written to stdout."""
+    output = io.StringIO()
+    monkeypatch.setattr("sys.stdout", output)
+    framebuffer.flush(cells, (80, 24))
+    return output.getvalue()
+
+
+def test_flush_wraps_frame_in_synchronized_update(framebuffer, monkeypatch):
+    """Test that every frame is written as one synchronized update."""
+    output = _flush(framebuffer, {(0, 0): ("a", None)}, monkeypatch)
+
+    assert output.startswith(BEGIN_SYNCHRONIZED_UPDATE)
+    assert output.endswith(END_SYNCHRONIZED_UPDATE)
+
+
+def test_flush_writes_changed_cells_as_runs(framebuffer, monkeypatch):
+    """Test that only changed cells are written, with one cursor move per run, and removed cells are blanked."""
+    move = framebuffer.term.move_xy
+    _flush(framebuffer, {(0, 0): ("a", None), (5, 5): ("x", None)}, monkeypatch)
+
+    output = _flush(framebuffer, {(0, 0): ("a", None), (1, 0): ("b", None), (2, 0): ("c", None)}, monkeypatch)
+
+    assert framebuffer.term.clear not in output
+    assert move(1, 0) + "bc" in output
+    assert move(5, 5) + " " in output
+    assert move(0, 0) + "a" not in output
+
+
+def test_flush_repaints_everything_periodically(framebuffer, monkeypatch):
+    """Test that the whole screen is repainted once the full repaint interval has passed."""
+    cells = {(0, 0): ("a", None)}
+    _flush(framebuffer, cells, monkeypatch)
+    assert framebuffer.term.clear not in _flush(framebuffer, cells, monkeypatch)
+
+    framebuffer._last_full_repaint -= FrameBuffer.FULL_REPAINT_INTERVAL
+
+    assert framebuffer.term.clear in _flush(framebuffer, cells, monkeypatch)
+
+
+def test_flush_repaints_everything_after_failed_write(framebuffer, monkeypatch):
+    """Test that a frame whose write failed is not used as the base of the next frame."""
+    _flush(framebuffer, {(0, 0): ("a", None)}, monkeypatch)
+
+    def broken_write(frame):
+        raise BrokenPipeError()
+
+    monkeypatch.setattr(framebuffer, "_write_frame", broken_write)
+    with pytest.raises(BrokenPipeError):
+        framebuffer.flush({(0, 0): ("b", None)}, (80, 24))
+    monkeypatch.undo()
+
+    assert framebuffer.term.clear in _flush(framebuffer, {(0, 0): ("b", None)}, monkeypatch)
+
+
+def test_write_frame_waits_for_non_blocking_terminal(framebuffer, monkeypatch):
+    """Test that a frame larger than the terminal buffer is written completely to a non-blocking descriptor."""
+    read_fd, write_fd = os.pipe()
+    os.set_blocking(write_fd, False)
+    stdout = io.TextIOWrapper(io.FileIO(write_fd, "w"), encoding="utf-8")
+    monkeypatch.setattr("sys.stdout", stdout)
+
+    # Drain the pipe slowly, so that writes hit a full buffer
+    received = []
+
+    def drain():
+        time.sleep(0.05)
+        while chunk := os.read(read_fd, 65536):
+            received.append(chunk)
+
+    reader = threading.Thread(target=drain)
+    reader.start()
+    try:
+        frame = "x" * (1 << 20)
+        framebuffer._write_frame(frame)
+    finally:
+        stdout.close()
+        reader.join()
+        os.close(read_fd)
+
+    assert b"".join(received) == frame.encode()
@@ -0,0 +1,64 @@
+"""
+Tests for the geographic helper functions.
+"""
+import numpy as np
+import pytest
+
+from open_aircraft_tracker.utils import geo
+from open_aircraft_tracker.utils.geo import bounding_box_mask, filter_within_radius, haversine_km
+
+
+def test_haversine_km_known_distance():
+    """Test the haversine distance between Zurich and Geneva."""
+    distances = haversine_km(47.3769, 8.5417, np.array([46.2044]), np.array([6.1432]))
+
+    # The great-circle distance is roughly 224 km
+    assert distances[0] == pytest.approx(224.0, abs=2.0)
+
+
+def test_filter_within_radius():
+    """Test filtering positions by radius, including missing positions."""
+    lats = np.array([47.3769, 47.40, 48.0, np.nan])
+    lons = np.array([8.5417, 8.55, 8.5417, 8.5417])
+
+    mask = filter_within_radius(47.3769, 8.5417, lats, lons, 5.0)
+
+    assert mask.tolist() == [True, True, False, False]
+
+
+def test_filter_within_radius_matches_numpy():
+    """Test that the radius filter agrees with the NumPy haversine distances."""
+    rng = np.random.default_rng(0)
+    lats = rng.uniform(45.0, 50.0, 1000)
+    lons = rng.uniform(5.0, 12.0, 1000)
+
+    mask = filter_within_radius(47.3769, 8.5417, lats, lons, 150.0)
+
+    assert mask.tolist() == (haversine_km(47.3769, 8.5417, lats, lons) <= 150.0).tolist()
+
+
+def test_bounding_box_mask_keeps_all_candidates():
+    """Test that the bounding box never drops a position within the radius, even across the antimeridian."""
+    rng = np.random.default_rng(1)
+    for center_lat, center_lon in [(47.3769, 8.5417), (-33.9, 179.9), (78.2, 15.6)]:
+        lats = np.clip(center_lat + rng.uniform(-5.0, 5.0, 1000), -90.0, 90.0)
+        lons = (center_lon + rng.uniform(-20.0, 20.0, 1000) + 180.0) % 360.0 - 180.0
+
+        bbox = bounding_box_mask(center_lat, center_lon, lats, lons, 200.0)
+        within = haversine_km(center_lat, center_lon, lats, lons) <= 200.0
+
+        assert not (within & ~bbox).any()
+        assert bbox.sum() < len(lats)
+
+
+def test_numpy_filter_matches_haversine(monkeypatch):
+    """Test that the NumPy fallback with its cheap prefilters agrees with the plain haversine."""
+    monkeypatch.setattr(geo, "_filter_within_radius_numba", None)
+    rng = np.random.default_rng(2)
+    for center_lat, center_lon in [(47.3769, 8.5417), (-33.9, 179.9), (78.2, 15.6)]:
+        lats = np.clip(center_lat + rng.uniform(-5.0, 5.0, 1000), -90.0, 90.0)
+        lons = (center_lon + rng.uniform(-20.0, 20.0, 1000) + 180.0) % 360.0 - 180.0
+
+        mask = filter_within_radius(center_lat, center_lon, lats, lons, 200.0)
+
+        assert mask.tolist() == (haversine_km(center_lat, center_lon, lats, lons) <= 200.0).tolist()
@@ -0,0 +1,64 @@
+"""
+Tests for the shared HTTP helpers used by the API clients.
+"""
+import time
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from open_aircraft_tracker.api._http import AsyncTokenBucket, close_session, fetch_json
+from open_aircraft_tracker.utils.cache import TTLCache
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_allows_burst():
+    """Test that the token bucket allows a burst up to its capacity."""
+    limiter = AsyncTokenBucket(max_tokens=5, refill_per_sec=1.0)
+
+    start = time.monotonic()
+    for _ in range(5):
+        await limiter.acquire()
+
+    assert time.monotonic() - start < 0.1
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_throttles_after_burst():
+    """Test that the token bucket waits for a refill once it is empty."""
+    limiter = AsyncTokenBucket(max_tokens=1, refill_per_sec=20.0)
+
+    await limiter.acquire()
+    start = time.monotonic()
+    await limiter.acquire()
+
+    assert time.monotonic() - start >= 0.04
+
+
+@pytest.mark.asyncio
+async def test_fetch_json_revalidates_expired_responses():
+    """Test that an expired response is revalidated with its ETag and reused when unchanged."""
+    conditional_headers = []
+
+    async def handler(request):
+        conditional_headers.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == '"v1"':
+            return web.Response(status=304)
+        return web.json_response({"states": [["abc123"]]}, headers={"ETag": '"v1"'})
+
+    app = web.Application()
+    app.router.add_get("/states", handler)
+    cache = TTLCache(ttl=0.05)
+
+    async with TestServer(app) as server:
+        url = str(server.make_url("/states"))
+        try:
+            first = await fetch_json(url, cache=cache)
+            assert await fetch_json(url, cache=cache) is first
+
+            time.sleep(0.06)
+            assert await fetch_json(url, cache=cache) is first
+        finally:
+            await close_session()
+
+    assert conditional_headers == [None, '"v1"']
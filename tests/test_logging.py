@@ -0,0 +1,36 @@
+"""
+Tests for the logging setup.
+"""
+import logging
+
+from open_aircraft_tracker.utils.logging import setup_logging, stop_logging
+
+
+def test_setup_logging_writes_queued_records(tmp_path):
+    """Test that records logged through the queue reach the log file once logging is stopped."""
+    log_file = tmp_path / "logs" / "tracker.log"
+    logger = setup_logging("INFO", str(log_file))
+    try:
+        assert all(isinstance(h, logging.handlers.QueueHandler) for h in logger.handlers)
+
+        logger.info("Tracking %d aircraft", 3)
+        logger.debug("Not written at INFO level")
+    finally:
+        stop_logging()
+
+    content = log_file.read_text()
+    assert "INFO - Tracking 3 aircraft" in content
+    assert "Not written" not in content
+
+
+def test_setup_logging_is_idempotent():
+    """Test that setting up logging again with the same settings keeps the running setup."""
+    logger = setup_logging("WARNING")
+    try:
+        handlers = list(logger.handlers)
+
+        assert setup_logging("warning").handlers == handlers
+        assert setup_logging("DEBUG").handlers != handlers
+        assert logger.level == logging.DEBUG
+    finally:
+        stop_logging()
@@ -4,26 +4,41 @@ Tests for the MockAPI class.
 import asyncio
 from datetime import datetime
 
+import numpy as np
 import pytest
 
+from open_aircraft_tracker.api.base import AircraftTrackerAPI
 from open_aircraft_tracker.api.mock import MockAPI
 
 
+# Center of the simulated traffic
+LATITUDE = 47.3769
+LONGITUDE = 8.5417
+
+
+@pytest.fixture(scope="module")
+def mock_api():
+    """Mock API with a fixed seed for reproducible results, with its aircraft already generated."""
+    api = MockAPI(num_aircraft=10, seed=42)
+    asyncio.run(api.get_aircraft_in_radius(LATITUDE, LONGITUDE, 100.0))
+    return api
+
+
 @pytest.mark.asyncio
 async def test_mock_api_get_aircraft_in_radius():
     """Test getting aircraft within a radius using the mock API."""
-    # Create a mock API with a fixed seed for reproducible results
+    # Queries advance the simulation, so this test uses its own client instead of the shared one
     api = MockAPI(num_aircraft=10, seed=42)
     
-    # Get aircraft within a radius
-    latitude = 47.3769
-    longitude = 8.5417
-    radius_km = 10.0
+    # New aircraft enter from 0.8 to 1.5 times three times the queried radius, 24 to 45 km here
+    await api.get_aircraft_in_radius(LATITUDE, LONGITUDE, 10.0)
     
-    aircraft_list = await api.get_aircraft_in_radius(latitude, longitude, radius_km)
+    # A radius that covers where they entered returns all of them
+    aircraft_list = await api.get_aircraft_in_radius(LATITUDE, LONGITUDE, 50.0)
+    assert len(aircraft_list) == 10
     
-    # Check that we got some aircraft
-    assert len(aircraft_list) > 0
+    # The first, smaller radius doesn't contain any of them yet
+    assert await api.get_aircraft_in_radius(LATITUDE, LONGITUDE, 10.0) == []
     
     # Check that all aircraft have the required fields
     for aircraft in aircraft_list:
@@ -39,23 +54,14 @@ async def test_mock_api_get_aircraft_in_radius():
 
 
 @pytest.mark.asyncio
-async def test_mock_api_get_aircraft_by_callsign():
-    """Test getting an aircraft by callsign using the mock API."""
-    # Create a mock API with a fixed seed for reproducible results
-    api = MockAPI(num_aircraft=10, seed=42)
-    
-    # First get all aircraft to populate the cache
-    latitude = 47.3769
-    longitude = 8.5417
-    radius_km = 100.0
-    
-    aircraft_list = await api.get_aircraft_in_radius(latitude, longitude, radius_km)
-    
-    # Get the callsign of the first aircraft
-    callsign = aircraft_list[0].callsign
+@pytest.mark.parametrize("transform", [str, str.lower, lambda c: f"  {c} "], ids=["exact", "lowercase", "padded"])
+async def test_mock_api_get_aircraft_by_callsign(mock_api, transform):
+    """Test getting an aircraft by callsign using the mock API, however the callsign is written."""
+    # Get the callsign of one of the simulated aircraft
+    callsign = next(iter(mock_api.aircraft_cache.values())).callsign
     
     # Get the aircraft by callsign
-    aircraft = await api.get_aircraft_by_callsign(callsign)
+    aircraft = await mock_api.get_aircraft_by_callsign(transform(callsign))
     
     # Check that we got the correct aircraft
     assert aircraft is not None
@@ -73,31 +79,50 @@ async def test_mock_api_aircraft_movement():
     longitude = 8.5417
     radius_km = 100.0
     
-    # Get initial positions
-    aircraft_list1 = await api.get_aircraft_in_radius(latitude, longitude, radius_km)
+    # Get initial positions of all simulated aircraft
+    await api.get_aircraft_in_radius(latitude, longitude, radius_km)
+    aircraft_list1 = list(api.aircraft_cache.values())
     
-    # Wait a bit to allow positions to update
-    await asyncio.sleep(1)
+    # Wait a bit, positions are advanced by the elapsed time
+    await asyncio.sleep(0.05)
     
     # Get updated positions
-    aircraft_list2 = await api.get_aircraft_in_radius(latitude, longitude, radius_km)
-    
-    # Check that positions have changed
-    for i in range(min(len(aircraft_list1), len(aircraft_list2))):
-        aircraft1 = aircraft_list1[i]
-        aircraft2 = None
-        
-        # Find the corresponding aircraft in the second list
-        for a in aircraft_list2:
-            if a.icao24 == aircraft1.icao24:
-                aircraft2 = a
-                break
-        
-        # Skip if the aircraft is no longer in the list
-        if aircraft2 is None:
-            continue
-        
-        # Check that at least one of the position components has changed
-        assert (aircraft1.latitude != aircraft2.latitude or
-                aircraft1.longitude != aircraft2.longitude or
-                aircraft1.altitude != aircraft2.altitude)
+    await api.get_aircraft_in_radius(latitude, longitude, radius_km)
+    aircraft_by_icao = api.aircraft_cache
+    
+    # Match the aircraft that are still simulated by ICAO24 address
+    matched = [(a, aircraft_by_icao[a.icao24]) for a in aircraft_list1 if a.icao24 in aircraft_by_icao]
+    assert matched
+    
+    # Check that every aircraft has moved
+    positions1 = np.array([(a1.latitude, a1.longitude) for a1, _ in matched])
+    positions2 = np.array([(a2.latitude, a2.longitude) for _, a2 in matched])
+    assert (positions1 != positions2).any(axis=1).all()
+
+
+@pytest.mark.asyncio
+async def test_gather_aircraft_in_radius_merges_clients():
+    """Test querying several clients at once, skipping failing clients and deduplicating aircraft."""
+    class FailingAPI(MockAPI):
+        async def get_aircraft_in_radius(self, latitude, longitude, radius_km):
+            raise RuntimeError("provider unavailable")
+    
+    api = MockAPI(num_aircraft=10, seed=42)
+    
+    latitude = 47.3769
+    longitude = 8.5417
+    radius_km = 100.0
+    
+    # Populate the cache so that both queries see the same aircraft
+    await api.get_aircraft_in_radius(latitude, longitude, radius_km)
+    
+    aircraft_list = await AircraftTrackerAPI.gather_aircraft_in_radius(
+        [api, api, FailingAPI()], latitude, longitude, radius_km
+    )
+    
+    # The same client queried twice must not produce duplicates
+    icao24s = [aircraft.icao24 for aircraft in aircraft_list]
+    assert len(icao24s) == len(set(icao24s))
+    assert set(icao24s) == {
+        aircraft.icao24 for aircraft in await api.get_aircraft_in_radius(latitude, longitude, radius_km)
+    }
@@ -0,0 +1,96 @@
+"""
+Tests for the terminal radar display.
+"""
+import io
+from datetime import datetime
+
+import pytest
+from blessed import Terminal
+
+from open_aircraft_tracker.api.base import Aircraft
+from open_aircraft_tracker.display.radar import RadarDisplay
+
+
+@pytest.fixture
+def radar():
+    """Create a radar display on a terminal that always writes escape sequences."""
+    term = Terminal(kind="xterm-256color", force_styling=True)
+    radar = RadarDisplay(term, radius_km=10.0)
+    radar.set_center(47.3769, 8.5417)
+    return radar
+
+
+def _draw(radar, monkeypatch):
+    """Draw a frame and return what was written to stdout."""
+    output = io.StringIO()
+    monkeypatch.setattr("sys.stdout", output)
+    radar.draw()
+    return output.getvalue()
+
+
+def test_draw_only_repaints_changes(radar, monkeypatch):
+    """Test that frames after the first one only write the cells that changed."""
+    aircraft = Aircraft("abc123", "SWR123", "Switzerland", 47.40, 8.55, 1000.0, 200.0, 90.0, 0.0, datetime.now())
+    radar.set_aircraft_list([aircraft])
+
+    first = _draw(radar, monkeypatch)
+    second = _draw(radar, monkeypatch)
+
+    assert radar.term.clear in first
+    assert radar.term.clear not in second
+    assert "SWR123" in first
+    assert "SWR123" not in second
+
+
+def test_invalidate_repaints_everything(radar, monkeypatch):
+    """Test that invalidating the display clears the screen on the next frame."""
+    _draw(radar, monkeypatch)
+    radar.invalidate()
+
+    assert radar.term.clear in _draw(radar, monkeypatch)
+
+
+def test_draw_skips_unchanged_aircraft(radar, monkeypatch):
+    """Test that the radar is only rendered again when the aircraft list changes."""
+    aircraft = Aircraft("abc123", "SWR123", "Switzerland", 47.40, 8.55, 1000.0, 200.0, 90.0, 0.0, datetime.now())
+    calls = []
+    compute = radar._compute_positions_batch
+    monkeypatch.setattr(radar, "_compute_positions_batch", lambda: calls.append(1) or compute())
+
+    radar.set_aircraft_list([aircraft])
+    _draw(radar, monkeypatch)
+    radar.set_aircraft_list([aircraft])
+    _draw(radar, monkeypatch)
+    assert len(calls) == 1
+
+    radar.set_aircraft_list([])
+    _draw(radar, monkeypatch)
+    assert len(calls) == 2
+
+
+def test_draw_skips_aircraft_with_only_a_newer_timestamp(radar, monkeypatch):
+    """Test that an aircraft that only has a newer timestamp doesn't render the radar again."""
+    calls = []
+    compute = radar._compute_positions_batch
+    monkeypatch.setattr(radar, "_compute_positions_batch", lambda: calls.append(1) or compute())
+
+    radar.set_aircraft_list([Aircraft("abc123", "SWR123", "Switzerland", 47.40, 8.55, 1000.0, 200.0, 90.0, 0.0, datetime(2024, 1, 1))])
+    _draw(radar, monkeypatch)
+    radar.set_aircraft_list([Aircraft("abc123", "SWR123", "Switzerland", 47.40, 8.55, 1000.0, 200.0, 90.0, 0.0, datetime(2024, 1, 2))])
+    _draw(radar, monkeypatch)
+
+    assert len(calls) == 1
+
+
+def test_draw_lays_out_radar_again_after_resize(radar, monkeypatch):
+    """Test that the radar is centered in the terminal again after it was resized."""
+    class ResizedTerminal(Terminal):
+        width = 100
+        height = 30
+
+    _draw(radar, monkeypatch)
+    radar.term = ResizedTerminal(kind="xterm-256color", force_styling=True)
+    output = _draw(radar, monkeypatch)
+
+    assert (radar.center_x, radar.center_y, radar.radar_radius) == (50, 15, 10)
+    assert radar.term.clear in output